@@ -6,23 +6,45 @@ Provides REST API endpoints for the frontend to interact with
 the Journey orchestrator and YAML workflow files.
 """
 
+import asyncio
+import copy
+import itertools
+import os
+import re
 import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import orjson
 import yaml
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
+# Backend directory; workflow paths in the API are relative to it
+_BASE_DIR = Path(__file__).resolve().parent
+
 # Add the src directory to the path to import journey
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+sys.path.insert(0, str(_BASE_DIR / "src"))
 
 from examples.guided_meditation.functions import register_meditation_tools
 from examples.what_is_the_status_of_my_loan.functions import register_acme_tools
 from journey import ActionRegistry, Orchestrator, ToolRegistry
 from journey.tool_registry import ToolDefinition
 
+# Prefer the libyaml C bindings; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 
 # Pydantic models for API requests/responses
 class WorkflowResponse(BaseModel):
@@ -43,14 +65,16 @@ class WorkflowListItem(BaseModel):
     variable_count: int
 
 
+# Request bodies are JSON, so keys are always strings; bare dict skips the
+# per-key str validation Dict[str, Any] would add
 class NodeRequest(BaseModel):
     id: str
     title: str
-    blocks: List[Dict[str, Any]]
+    blocks: List[dict]
 
 
 class WorkflowExecutionRequest(BaseModel):
-    session_state: Dict[str, Any]
+    session_state: dict
 
 
 class WorkflowExecutionResponse(BaseModel):
@@ -70,102 +94,256 @@ class ToolCatalogResponse(BaseModel):
 
 # Global state
 workflows_cache: Dict[str, Dict[str, Any]] = {}
+workflow_mtimes: Dict[str, int] = {}
+# ETag per cached workflow; changes whenever the cached data does
+workflow_etags: Dict[str, str] = {}
+# Rebuilt lazily by list_workflows; reset whenever workflows_cache changes
+workflow_list_cache: Optional[List[Dict[str, Any]]] = None
+# Orchestrators keyed by workflow path, with the file mtime they were built from
+orchestrator_cache: Dict[str, Tuple[int, Orchestrator]] = {}
+# Per-file locks: writes to the same workflow never overlap, and re-reads
+# of a file never interleave with a write to it
+_write_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+# Order in which writes were requested, and the latest one on disk per file
+_write_sequence = itertools.count()
+_written_sequence: Dict[str, int] = {}
 action_registry = ActionRegistry()
 tool_registry = ToolRegistry()
+# Prebuilt catalog payloads; refresh with _refresh_catalogs
+# after registering
+tool_catalog_json = b""
+action_catalog_json = b""
+
 
-# Initialize immediately
-register_acme_tools(tool_registry)
-print("Registered ACME Financial tools")
-register_meditation_tools(tool_registry)
-print("Registered Guided Meditation tools")
+def _catalog_json(
+    key: str, definitions: List[Dict[str, Any]], categories: List[str]
+) -> bytes:
+    """Serialize dumped registry definitions and their categories to JSON"""
+    return orjson.dumps({key: definitions, "categories": categories})
+
+
+def _refresh_catalogs() -> None:
+    """Rebuild the cached catalog payloads from the current registries"""
+    global tool_catalog_json, action_catalog_json
+    tools = tool_registry.list_tools()
+    actions = action_registry.list_actions()
+    tool_categories = sorted({tool.category for tool in tools})
+    action_categories = sorted({action.category for action in actions})
+    tool_catalog_json = _catalog_json(
+        "tools", [tool.model_dump(mode="json") for tool in tools], tool_categories
+    )
+    action_catalog_json = _catalog_json(
+        "actions", [action.to_dict() for action in actions], action_categories
+    )
+
+
+def _register_tools() -> None:
+    """Register the example tool sets"""
+    # One thread, in a fixed order, so catalog ordering stays deterministic
+    register_acme_tools(tool_registry)
+    print("Registered ACME Financial tools")
+    register_meditation_tools(tool_registry)
+    print("Registered Guided Meditation tools")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Register tools and load workflows concurrently on startup"""
+    await asyncio.gather(
+        asyncio.to_thread(_register_tools),
+        load_available_workflows(),
+    )
+    _refresh_catalogs()
+    yield
 
 
 app = FastAPI(
     title="Journey Workflow API",
     description="API for managing and executing Journey workflows",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS for Next.js frontend
+# Pure-ASGI middleware only - do not use BaseHTTPMiddleware here; it spawns an
+# extra task per request. Write new middleware as a class with
+# __call__(scope, receive, send) that wraps `await self.app(scope, receive, send)`.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:3001",
-        "http://localhost:3002",
-        "http://localhost:5173",
-        "http://localhost:8080",
-        "http://localhost:8081",
-        "http://localhost:8082",
-        "http://localhost:8083",
-        "http://localhost:8084",
-        "http://localhost:8085",
-        "http://localhost:8086",
-        "http://localhost:8087",
-        "http://localhost:8088",
-        "http://localhost:8089",
-        "http://localhost:8090",
-        "http://localhost:8091",
-        "http://localhost:8092",
-        "http://localhost:8093",
-        "http://localhost:8094",
-        "http://localhost:8095",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:3001",
-        "http://127.0.0.1:3002",
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:8080",
-        "http://127.0.0.1:8081",
-        "http://127.0.0.1:8082",
-        "http://127.0.0.1:8083",
-        "http://127.0.0.1:8084",
-        "http://127.0.0.1:8085",
-        "http://127.0.0.1:8086",
-        "http://127.0.0.1:8087",
-        "http://127.0.0.1:8088",
-        "http://127.0.0.1:8089",
-        "http://127.0.0.1:8090",
-        "http://127.0.0.1:8091",
-        "http://127.0.0.1:8092",
-        "http://127.0.0.1:8093",
-        "http://127.0.0.1:8094",
-        "http://127.0.0.1:8095",
-    ],
+    # localhost / 127.0.0.1 on ports 3000-3002, 5173 and 8080-8095
+    allow_origin_regex=r"http://(localhost|127\.0\.0\.1):(300[0-2]|5173|808[0-9]|809[0-5])",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file, reading it as bytes so libyaml can decode it directly"""
+    with open(path, "rb") as f:
+        return yaml.load(f.read(), Loader=_YamlLoader)
+
+
+def _dump_yaml(data: Any, path: Path) -> None:
+    """Write data to a YAML file using the workflow formatting conventions
+
+    The file is replaced atomically, so readers see either the old or the
+    new contents and never a truncated file.
+    """
+    # Emit straight to UTF-8 bytes, then write them to a sibling temp file
+    content = yaml.dump(
+        data,
+        Dumper=_YamlDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+        width=None,
+        indent=2,
+        encoding="utf-8",
+    )
+    # Same directory, so os.replace is a rename on one filesystem
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_bytes(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_workflow(full_path: Path) -> Dict[str, Any]:
+    """Parse a workflow file, substituting an empty workflow for empty files"""
+    workflow_data = _load_yaml(full_path)
+    # Handle empty YAML files
+    if workflow_data is None:
+        workflow_data = {
+            "id": full_path.stem,
+            "name": full_path.stem.replace("_", " ").title(),
+            "description": "Empty workflow",
+            "variables": [],
+            "nodes": [],
+        }
+    return workflow_data
+
+
+def _cache_workflow(
+    workflow_path: str, workflow_data: Dict[str, Any], version: Optional[int] = None
+) -> None:
+    """Store a workflow in the cache and invalidate the derived workflow list
+
+    version is the file mtime when the data was read from disk; in-memory
+    edits get a fresh timestamp since their write may not have landed yet.
+    """
+    global workflow_list_cache
+    workflows_cache[workflow_path] = workflow_data
+    workflow_etags[workflow_path] = f'W/"{version or time.time_ns():x}"'
+    workflow_list_cache = None
+
+
+def _parse_workflow_file(workflow_path: str) -> Tuple[int, Dict[str, Any]]:
+    """Parse a workflow file, returning its mtime alongside the data"""
+    full_path = _BASE_DIR / workflow_path
+    mtime = full_path.stat().st_mtime_ns
+    return mtime, _read_workflow(full_path)
+
+
+def _get_workflow(workflow_path: str) -> Dict[str, Any]:
+    """Get a workflow from the cache, re-parsing the file only if its mtime changed"""
+    full_path = _BASE_DIR / workflow_path
+    # Held across stat and re-parse so a write to this file cannot land in
+    # between and leave the parsed data cached under the wrong mtime
+    with _write_locks[workflow_path]:
+        mtime = full_path.stat().st_mtime_ns
+        if workflow_path in workflows_cache and workflow_mtimes.get(workflow_path) == mtime:
+            return workflows_cache[workflow_path]
+
+        workflow_data = _read_workflow(full_path)
+        _cache_workflow(workflow_path, workflow_data, mtime)
+        workflow_mtimes[workflow_path] = mtime
+    return workflow_data
+
+
+def _persist_workflow(
+    workflow_path: str, workflow_data: Dict[str, Any], sequence: int
+) -> None:
+    """Write a workflow snapshot to disk and record its new mtime"""
+    full_path = _BASE_DIR / workflow_path
+    # Writers and _get_workflow's re-reads share this per-file lock, so
+    # neither overlaps a write; a snapshot older than the last one written is stale
+    with _write_locks[workflow_path]:
+        if sequence < _written_sequence.get(workflow_path, -1):
+            return
+        try:
+            _dump_yaml(workflow_data, full_path)
+        except Exception:
+            # Force the next read to go back to disk
+            workflow_mtimes.pop(workflow_path, None)
+            raise
+        _written_sequence[workflow_path] = sequence
+        workflow_mtimes[workflow_path] = full_path.stat().st_mtime_ns
+    orchestrator_cache.pop(workflow_path, None)
+
+
+async def _write_workflow(workflow_path: str, workflow_data: Dict[str, Any]) -> None:
+    """Write a workflow to disk and record it in the cache"""
+    _cache_workflow(workflow_path, workflow_data)
+    # Node edits mutate the cached dict in place, so the writer thread gets
+    # its own copy rather than one that can change mid-dump
+    snapshot = copy.deepcopy(workflow_data)
+    await asyncio.to_thread(
+        _persist_workflow, workflow_path, snapshot, next(_write_sequence)
+    )
+
+
+def _get_orchestrator(workflow_path: str) -> Orchestrator:
+    """Get a cached orchestrator, rebuilding it if the workflow file changed"""
+    full_path = _BASE_DIR / workflow_path
+    mtime = full_path.stat().st_mtime_ns
+    cached = orchestrator_cache.get(workflow_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    orchestrator = Orchestrator(str(full_path), action_registry, tool_registry)
+    orchestrator_cache[workflow_path] = (mtime, orchestrator)
+    return orchestrator
+
+
+def _iter_yaml(root: Path) -> Iterator[str]:
+    """Yield paths of .yaml files under root, using os.scandir's cached entry types"""
+    stack = [os.fspath(root)]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file() and entry.name.endswith(".yaml"):
+                    yield entry.path
+        # Reversed so subdirectories are visited in scan order, like rglob
+        stack.extend(reversed(subdirs))
+
+
 async def load_available_workflows():
     """Load all available workflow files"""
-    # Load from examples directory
-    examples_dir = Path(__file__).parent / "examples"
-    for yaml_file in examples_dir.rglob("*.yaml"):
-        try:
-            with open(yaml_file, "r", encoding="utf-8") as f:
-                workflow_data = yaml.safe_load(f)
-                # Handle empty YAML files
-                if workflow_data is None:
-                    workflow_data = {
-                        "id": yaml_file.stem,
-                        "name": yaml_file.stem.replace("_", " ").title(),
-                        "description": "Empty workflow",
-                        "variables": [],
-                        "nodes": [],
-                    }
-                # Make path relative to backend directory
-                relative_path = yaml_file.relative_to(Path(__file__).parent)
-                workflows_cache[str(relative_path)] = workflow_data
-                print(f"Loaded workflow: {relative_path}")
-        except Exception as e:
-            print(f"Failed to load workflow {yaml_file}: {e}")
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Load workflows on startup"""
-    await load_available_workflows()
+    # Load from examples directory; libyaml releases the GIL, so parse in parallel
+    examples_dir = _BASE_DIR / "examples"
+    # Make paths relative to backend directory
+    relative_paths = [
+        os.path.relpath(yaml_file, _BASE_DIR) for yaml_file in _iter_yaml(examples_dir)
+    ]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_parse_workflow_file, path) for path in relative_paths),
+        return_exceptions=True,
+    )
+    for relative_path, result in zip(relative_paths, results):
+        if isinstance(result, Exception):
+            print(f"Failed to load workflow {relative_path}: {result}")
+            continue
+        mtime, workflow_data = result
+        _cache_workflow(relative_path, workflow_data, mtime)
+        workflow_mtimes[relative_path] = mtime
+        print(f"Loaded workflow: {relative_path}")
 
 
 @app.get("/")
@@ -177,86 +355,86 @@ async def root():
 @app.get("/api/workflows", response_model=List[WorkflowListItem])
 async def list_workflows():
     """Get list of available workflows"""
-    workflows = []
-    for path, data in workflows_cache.items():
-        workflows.append(
-            WorkflowListItem(
-                path=path,
-                id=data.get("id", "unknown"),
-                name=data.get("name", "Untitled"),
-                description=data.get("description", ""),
-                node_count=len(data.get("nodes", [])),
-                variable_count=len(data.get("variables", [])),
-            )
-        )
-    return workflows
+    global workflow_list_cache
+    if workflow_list_cache is None:
+        workflow_list_cache = [
+            {
+                "path": path,
+                "id": data.get("id", "unknown"),
+                "name": data.get("name", "Untitled"),
+                "description": data.get("description", ""),
+                "node_count": len(data.get("nodes", [])),
+                "variable_count": len(data.get("variables", [])),
+            }
+            for path, data in workflows_cache.items()
+        ]
+    return workflow_list_cache
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (RFC 9110 weak comparison)"""
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
 
 
 @app.get("/api/workflows/{workflow_path:path}", response_model=WorkflowResponse)
-async def get_workflow(workflow_path: str):
+async def get_workflow(
+    workflow_path: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+):
     """Get a specific workflow"""
-    # Try to find in cache first
-    if workflow_path in workflows_cache:
-        data = workflows_cache[workflow_path]
-        return WorkflowResponse(
-            id=data.get("id", "unknown"),
-            name=data.get("name", "Untitled"),
-            description=data.get("description", ""),
-            variables=data.get("variables", []),
-            nodes=data.get("nodes", []),
-            path=workflow_path,
-        )
+    full_path = _BASE_DIR / workflow_path
+    if not full_path.exists():
+        raise HTTPException(status_code=404, detail="Workflow not found")
 
-    # Try to load if not in cache
-    full_path = Path(__file__).parent / workflow_path
-    if full_path.exists():
-        try:
-            with open(full_path, "r", encoding="utf-8") as f:
-                workflow_data = yaml.safe_load(f)
-                workflows_cache[workflow_path] = workflow_data
-                return WorkflowResponse(
-                    id=workflow_data.get("id", "unknown"),
-                    name=workflow_data.get("name", "Untitled"),
-                    description=workflow_data.get("description", ""),
-                    variables=workflow_data.get("variables", []),
-                    nodes=workflow_data.get("nodes", []),
-                    path=workflow_path,
-                )
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to load workflow: {e}")
-
-    raise HTTPException(status_code=404, detail="Workflow not found")
+    try:
+        data = await asyncio.to_thread(_get_workflow, workflow_path)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to load workflow: {e}")
+
+    # Let polling clients skip the body when nothing changed
+    etag = workflow_etags[workflow_path]
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    # response_model validates the dict once; no need to build the model here
+    return {
+        "id": data.get("id", "unknown"),
+        "name": data.get("name", "Untitled"),
+        "description": data.get("description", ""),
+        "variables": data.get("variables", []),
+        "nodes": data.get("nodes", []),
+        "path": workflow_path,
+    }
 
 
 @app.put("/api/workflows/{workflow_path:path}")
 async def save_workflow(workflow_path: str, workflow_data: Dict[str, Any]):
     """Save a workflow"""
-    full_path = Path(__file__).parent / workflow_path
+    full_path = _BASE_DIR / workflow_path
 
     try:
         # Ensure directory exists
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save the workflow
-        with open(full_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(
-                workflow_data,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-                width=None,
-                indent=2,
-            )
-
-        # Update cache
-        workflows_cache[workflow_path] = workflow_data
+        # Save the workflow and update cache
+        await _write_workflow(workflow_path, workflow_data)
 
         return {"message": "Workflow saved successfully", "path": workflow_path}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save workflow: {e}")
 
 
+_FOLDER_NAME_TRANSLATION = str.maketrans({" ": "_", "-": "_"})
+_FOLDER_NAME_INVALID_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
 class CreateWorkflowRequest(BaseModel):
     name: str
     description: str = ""
@@ -267,20 +445,18 @@ async def create_new_workflow(request: CreateWorkflowRequest):
     """Create a new workflow with an empty structure"""
     try:
         # Create folder name from workflow name (sanitize for filesystem)
-        folder_name = request.name.lower().replace(" ", "_").replace("-", "_")
+        folder_name = request.name.lower().translate(_FOLDER_NAME_TRANSLATION)
         # Remove any non-alphanumeric characters except underscores
-        import re
-
-        folder_name = re.sub(r"[^a-zA-Z0-9_]", "", folder_name)
+        folder_name = _FOLDER_NAME_INVALID_CHARS.sub("", folder_name)
 
         # Create the examples subfolder
-        examples_dir = Path(__file__).parent / "examples" / folder_name
+        examples_dir = _BASE_DIR / "examples" / folder_name
         examples_dir.mkdir(parents=True, exist_ok=True)
 
         # Create the workflow file
         workflow_filename = f"{folder_name}.yaml"
         workflow_path = examples_dir / workflow_filename
-        relative_path = workflow_path.relative_to(Path(__file__).parent)
+        relative_path = workflow_path.relative_to(_BASE_DIR)
 
         # Create empty workflow structure
         empty_workflow = {
@@ -291,20 +467,8 @@ async def create_new_workflow(request: CreateWorkflowRequest):
             "nodes": [],
         }
 
-        # Save the workflow
-        with open(workflow_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(
-                empty_workflow,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-                width=None,
-                indent=2,
-            )
-
-        # Update cache
-        workflows_cache[str(relative_path)] = empty_workflow
+        # Save the workflow and update cache
+        await _write_workflow(str(relative_path), empty_workflow)
 
         return {
             "message": "Workflow created successfully",
@@ -316,24 +480,25 @@ async def create_new_workflow(request: CreateWorkflowRequest):
         raise HTTPException(status_code=500, detail=f"Failed to create workflow: {e}")
 
 
-@app.post("/api/workflows/{workflow_path:path}/execute")
+@app.post(
+    "/api/workflows/{workflow_path:path}/execute",
+    response_model=WorkflowExecutionResponse,
+)
 async def execute_workflow_step(workflow_path: str, request: WorkflowExecutionRequest):
     """Execute the next step in a workflow"""
-    full_path = Path(__file__).parent / workflow_path
+    full_path = _BASE_DIR / workflow_path
 
     if not full_path.exists():
         raise HTTPException(status_code=404, detail="Workflow not found")
 
     try:
-        # Create orchestrator
-        orchestrator = Orchestrator(str(full_path), action_registry, tool_registry)
+        # Reuse the orchestrator for this workflow unless the file changed
+        orchestrator = _get_orchestrator(workflow_path)
 
         # Get next actions
         actions = orchestrator.get_next_step(request.session_state)
 
-        return WorkflowExecutionResponse(
-            actions=actions, session_state=request.session_state
-        )
+        return {"actions": actions, "session_state": request.session_state}
     except Exception as e:
         print(f"Workflow execution error: {e}")
         raise HTTPException(status_code=500, detail=f"Workflow execution failed: {e}")
@@ -342,10 +507,7 @@ async def execute_workflow_step(workflow_path: str, request: WorkflowExecutionRe
 @app.get("/api/tools", response_model=ToolCatalogResponse)
 async def get_tool_catalog():
     """Get all available tools with their type information"""
-    tools = tool_registry.list_tools()
-    categories = list(set(tool.category for tool in tools))
-
-    return ToolCatalogResponse(tools=tools, categories=sorted(categories))
+    return Response(content=tool_catalog_json, media_type="application/json")
 
 
 @app.get("/api/tools/{tool_name}", response_model=ToolDefinition)
@@ -390,15 +552,14 @@ async def get_functions_by_category_legacy(category: str):
 @app.post("/api/workflows/{workflow_path:path}/nodes/{node_index}")
 async def update_node(workflow_path: str, node_index: int, node_data: NodeRequest):
     """Update a specific node in a workflow"""
-    full_path = Path(__file__).parent / workflow_path
+    full_path = _BASE_DIR / workflow_path
 
     if not full_path.exists():
         raise HTTPException(status_code=404, detail="Workflow not found")
 
     try:
-        # Load current workflow
-        with open(full_path, "r", encoding="utf-8") as f:
-            workflow = yaml.safe_load(f)
+        # Get current workflow
+        workflow = await asyncio.to_thread(_get_workflow, workflow_path)
 
         # Update the node
         if 0 <= node_index < len(workflow.get("nodes", [])):
@@ -408,20 +569,8 @@ async def update_node(workflow_path: str, node_index: int, node_data: NodeReques
                 "blocks": node_data.blocks,
             }
 
-            # Save back to file
-            with open(full_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(
-                    workflow,
-                    f,
-                    default_flow_style=False,
-                    sort_keys=False,
-                    allow_unicode=True,
-                    width=None,
-                    indent=2,
-                )
-
-            # Update cache
-            workflows_cache[workflow_path] = workflow
+            # Save back to file and update cache
+            await _write_workflow(workflow_path, workflow)
 
             return {"message": "Node updated successfully"}
         else:
@@ -434,15 +583,14 @@ async def update_node(workflow_path: str, node_index: int, node_data: NodeReques
 @app.post("/api/workflows/{workflow_path:path}/nodes")
 async def add_node(workflow_path: str, node_data: NodeRequest):
     """Add a new node to a workflow"""
-    full_path = Path(__file__).parent / workflow_path
+    full_path = _BASE_DIR / workflow_path
 
     if not full_path.exists():
         raise HTTPException(status_code=404, detail="Workflow not found")
 
     try:
-        # Load current workflow
-        with open(full_path, "r", encoding="utf-8") as f:
-            workflow = yaml.safe_load(f)
+        # Get current workflow
+        workflow = await asyncio.to_thread(_get_workflow, workflow_path)
 
         # Add the new node
         new_node = {
@@ -455,20 +603,8 @@ async def add_node(workflow_path: str, node_data: NodeRequest):
             workflow["nodes"] = []
         workflow["nodes"].append(new_node)
 
-        # Save back to file
-        with open(full_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(
-                workflow,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-                width=None,
-                indent=2,
-            )
-
-        # Update cache
-        workflows_cache[workflow_path] = workflow
+        # Save the workflow and update cache
+        await _write_workflow(workflow_path, workflow)
 
         return {
             "message": "Node added successfully",
@@ -482,34 +618,21 @@ async def add_node(workflow_path: str, node_data: NodeRequest):
 @app.delete("/api/workflows/{workflow_path:path}/nodes/{node_index}")
 async def delete_node(workflow_path: str, node_index: int):
     """Delete a node from a workflow"""
-    full_path = Path(__file__).parent / workflow_path
+    full_path = _BASE_DIR / workflow_path
 
     if not full_path.exists():
         raise HTTPException(status_code=404, detail="Workflow not found")
 
     try:
-        # Load current workflow
-        with open(full_path, "r", encoding="utf-8") as f:
-            workflow = yaml.safe_load(f)
+        # Get current workflow
+        workflow = await asyncio.to_thread(_get_workflow, workflow_path)
 
         # Delete the node
         if 0 <= node_index < len(workflow.get("nodes", [])):
             deleted_node = workflow["nodes"].pop(node_index)
 
-            # Save back to file
-            with open(full_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(
-                    workflow,
-                    f,
-                    default_flow_style=False,
-                    sort_keys=False,
-                    allow_unicode=True,
-                    width=None,
-                    indent=2,
-                )
-
-            # Update cache
-            workflows_cache[workflow_path] = workflow
+            # Save back to file and update cache
+            await _write_workflow(workflow_path, workflow)
 
             return {
                 "message": "Node deleted successfully",
@@ -522,87 +645,90 @@ async def delete_node(workflow_path: str, node_index: int):
         raise HTTPException(status_code=500, detail=f"Failed to delete node: {e}")
 
 
+# Static payloads, serialized once at import time
+_BLOCK_TYPES = {
+    "PRESENT_CONTENT": {
+        "description": "Display content to the user",
+        "required_fields": ["payload"],
+        "optional_fields": [],
+        "field_types": {"payload": "text"},
+    },
+    "AWAIT_USER_INPUT": {
+        "description": "Wait for user input and store in variable",
+        "required_fields": [],
+        "optional_fields": ["target"],
+        "field_types": {"target": "variable_name"},
+    },
+    "SET_VARIABLE": {
+        "description": "Set a variable to a specific value",
+        "required_fields": ["target", "source"],
+        "optional_fields": [],
+        "field_types": {"target": "variable_name", "source": "text_or_function"},
+    },
+    "UPDATE_VARIABLE": {
+        "description": "Update a variable with an operation",
+        "required_fields": ["target", "source", "operation"],
+        "optional_fields": [],
+        "field_types": {
+            "target": "variable_name",
+            "source": "text",
+            "operation": "operation_type",
+        },
+    },
+    "ANALYZE_RESPONSE": {
+        "description": "Analyze a response using a function",
+        "required_fields": ["input", "criteria", "output_bool"],
+        "optional_fields": [],
+        "field_types": {
+            "input": "variable_reference",
+            "criteria": "function_name",
+            "output_bool": "variable_name",
+        },
+    },
+    "CONDITION": {
+        "description": "Conditional logic with structured rules",
+        "required_fields": ["rules"],
+        "optional_fields": [],
+        "field_types": {"rules": "structured_condition_rules"},
+    },
+    "GOTO_NODE": {
+        "description": "Navigate to another node",
+        "required_fields": ["target"],
+        "optional_fields": [],
+        "field_types": {"target": "node_id"},
+    },
+    "END_WORKFLOW": {
+        "description": "End the workflow execution",
+        "required_fields": [],
+        "optional_fields": [],
+        "field_types": {},
+    },
+}
+_BLOCK_TYPES_JSON = orjson.dumps(_BLOCK_TYPES)
+
+_COMMON_VARIABLES = [
+    "Context",
+    "Latest User Response",
+]
+_COMMON_VARIABLES_JSON = orjson.dumps({"variables": _COMMON_VARIABLES})
+
+
 @app.get("/api/block-types")
 async def get_block_types():
     """Get available block types and their schemas"""
-    block_types = {
-        "PRESENT_CONTENT": {
-            "description": "Display content to the user",
-            "required_fields": ["payload"],
-            "optional_fields": [],
-            "field_types": {"payload": "text"},
-        },
-        "AWAIT_USER_INPUT": {
-            "description": "Wait for user input and store in variable",
-            "required_fields": [],
-            "optional_fields": ["target"],
-            "field_types": {"target": "variable_name"},
-        },
-        "SET_VARIABLE": {
-            "description": "Set a variable to a specific value",
-            "required_fields": ["target", "source"],
-            "optional_fields": [],
-            "field_types": {"target": "variable_name", "source": "text_or_function"},
-        },
-        "UPDATE_VARIABLE": {
-            "description": "Update a variable with an operation",
-            "required_fields": ["target", "source", "operation"],
-            "optional_fields": [],
-            "field_types": {
-                "target": "variable_name",
-                "source": "text",
-                "operation": "operation_type",
-            },
-        },
-        "ANALYZE_RESPONSE": {
-            "description": "Analyze a response using a function",
-            "required_fields": ["input", "criteria", "output_bool"],
-            "optional_fields": [],
-            "field_types": {
-                "input": "variable_reference",
-                "criteria": "function_name",
-                "output_bool": "variable_name",
-            },
-        },
-        "CONDITION": {
-            "description": "Conditional logic with structured rules",
-            "required_fields": ["rules"],
-            "optional_fields": [],
-            "field_types": {"rules": "structured_condition_rules"},
-        },
-        "GOTO_NODE": {
-            "description": "Navigate to another node",
-            "required_fields": ["target"],
-            "optional_fields": [],
-            "field_types": {"target": "node_id"},
-        },
-        "END_WORKFLOW": {
-            "description": "End the workflow execution",
-            "required_fields": [],
-            "optional_fields": [],
-            "field_types": {},
-        },
-    }
-    return block_types
+    return Response(content=_BLOCK_TYPES_JSON, media_type="application/json")
 
 
 @app.get("/api/variables")
 async def get_common_variables():
     """Get commonly used variable names"""
-    common_variables = [
-        "Context",
-        "Latest User Response",
-    ]
-    return {"variables": common_variables}
+    return Response(content=_COMMON_VARIABLES_JSON, media_type="application/json")
 
 
 @app.get("/api/actions")
 async def get_action_catalog():
     """Get all available actions with their type information"""
-    actions = action_registry.list_actions()
-    categories = list(set(action.category for action in actions))
-
-    return {"actions": actions, "categories": categories}
+    return Response(content=action_catalog_json, media_type="application/json")
 
 
 @app.get("/api/actions/{action_name}")
@@ -629,4 +755,15 @@ if __name__ == "__main__":
     import uvicorn
 
     print("Starting Journey API server...")
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=False)
+    # uvloop and httptools ship with uvicorn[standard]; request them explicitly
+    # so a missing extra fails loudly instead of silently falling back to asyncio
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        reload=False,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False,
+    )
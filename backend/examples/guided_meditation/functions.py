@@ -7,10 +7,156 @@ including breathing patterns, mindfulness techniques, and personalization.
 """
 
 import random
-from typing import Dict, List
+import re
+from typing import Dict, List, Tuple
 
 from journey.tool_registry import ToolRegistry
 
+# Words that signal each stress tier in a user's responses
+_STRESS_INDICATORS = {
+    'high': ('anxious', 'overwhelmed', 'stressed', 'panicked', 'racing', 'tense', 'worried'),
+    'moderate': ('busy', 'tired', 'restless', 'distracted', 'uncomfortable'),
+    'low': ('calm', 'peaceful', 'relaxed', 'content', 'balanced', 'centered')
+}
+
+# Indicator word -> tier bit (high = 2, moderate = 1); low-stress words never
+# change the outcome, so skip them
+_STRESS_BITS = {
+    word: bit
+    for tier, bit in (('high', 2), ('moderate', 1))
+    for word in _STRESS_INDICATORS[tier]
+}
+
+# Stress level indexed by the OR of the bits seen
+_TIERS = ('low', 'moderate', 'high', 'high')
+
+# Single pass over the text; the lookahead lets matches overlap, so every
+# indicator is found wherever a plain substring check would find it
+_STRESS_PATTERN = re.compile('(?=(' + '|'.join(map(re.escape, _STRESS_BITS)) + '))')
+
+# Static lookup tables, built once at import
+_PATTERNS = {
+    '4-7-8': {'inhale': 4, 'hold': 7, 'exhale': 8},
+    'box': {'inhale': 4, 'hold': 4, 'exhale': 4},
+    'triangle': {'inhale': 4, 'hold': 0, 'exhale': 4},
+    'simple': {'inhale': 3, 'hold': 0, 'exhale': 3}
+}
+
+_SIMPLE_DEFAULT = _PATTERNS['simple']
+
+_PROMPTS = {
+    'breath': (
+        "Notice the natural rhythm of your breath. Feel the air flowing in and out.",
+        "Observe your breath without trying to change it. Simply be aware.",
+        "Feel the sensation of breathing in your nostrils and chest."
+    ),
+    'body': (
+        "Scan your body from head to toe, noticing any sensations.",
+        "Feel the weight of your body and how it's supported.",
+        "Notice areas of tension or relaxation in your body."
+    ),
+    'thoughts': (
+        "Observe your thoughts like clouds passing in the sky.",
+        "Notice thoughts arising and passing away without judgment.",
+        "When you notice thinking, gently return attention to the present."
+    ),
+    'emotions': (
+        "Notice any emotions present without trying to change them.",
+        "Breathe with whatever feelings are here right now.",
+        "Allow emotions to be as they are, with kindness."
+    ),
+    'gratitude': (
+        "Bring to mind something you're grateful for today.",
+        "Feel the warmth of appreciation in your heart.",
+        "Notice three things you appreciate about this moment."
+    )
+}
+
+_DEFAULT_PROMPTS = _PROMPTS['breath']
+
+# Private generator so prompt selection doesn't go through the shared global one
+_PROMPT_RNG = random.Random()
+_choice = _PROMPT_RNG.choice
+
+_AFFIRM_TEMPLATES = {
+    'peace': "May {name}find deep peace and tranquility.",
+    'strength': "May {name}discover your inner strength and resilience.",
+    'clarity': "May {name}gain clarity and insight.",
+    'healing': "May {name}experience healing and renewal.",
+    'gratitude': "May {name}feel grateful for all the goodness in your life.",
+    'love': "May {name}feel love and compassion for yourself and others.",
+    'focus': "May {name}develop clear focus and concentration."
+}
+
+
+def _split_template(template: str) -> Tuple[str, str]:
+    """Split a template around its single {name} placeholder."""
+    prefix, _, suffix = template.partition('{name}')
+    return prefix, suffix
+
+
+# Templates pre-split so building an affirmation is plain concatenation
+_AFFIRM_PARTS = {key: _split_template(template) for key, template in _AFFIRM_TEMPLATES.items()}
+_DEFAULT_AFFIRM_PARTS = ("May ", "find what you're seeking in this practice.")
+
+# Map common synonyms/phrases to template keys (covers 'heart' → love)
+_SYNONYMS = {
+    'peace': ['peace', 'calm', 'relax', 'relaxed', 'tranquil', 'ease'],
+    'strength': ['strength', 'resilience', 'power', 'courage'],
+    'clarity': ['clarity', 'clear', 'insight', 'understand', 'focus'],
+    'healing': ['healing', 'heal', 'recover', 'renewal'],
+    'gratitude': ['gratitude', 'grateful', 'appreciation', 'appreciate'],
+    'love': ['love', 'heart', 'compassion', 'kindness', 'connection'],
+    'focus': ['focus', 'concentration', 'concentrate', 'attention']
+}
+
+# Synonym -> template key, inverted once; built in reverse so a word listed
+# under several keys keeps the first one, matching the order keys are checked in
+_SYNONYM_LOOKUP = {
+    word: key for key, words in reversed(list(_SYNONYMS.items())) for word in words
+}
+_SYNONYM_PRIORITY = {key: index for index, key in enumerate(_SYNONYMS)}
+
+# All synonyms in one pattern, ordered by key priority so that when two
+# synonyms start at the same position the higher-priority key wins
+_SYNONYM_PATTERN = re.compile(
+    '(?=('
+    + '|'.join(
+        re.escape(word)
+        for word in sorted(
+            _SYNONYM_LOOKUP, key=lambda word: _SYNONYM_PRIORITY[_SYNONYM_LOOKUP[word]]
+        )
+    )
+    + '))'
+)
+
+# (stress level, time category) -> meditation path
+_PATH_TABLE = {
+    ('high', 'short'): 'quick_calm',
+    ('high', 'medium'): 'deep_restoration',
+    ('high', 'long'): 'deep_restoration',
+    ('moderate', 'short'): 'gentle_journey',
+    ('moderate', 'medium'): 'gentle_journey',
+    ('moderate', 'long'): 'peaceful_exploration',
+    ('low', 'short'): 'gentle_journey',
+    ('low', 'medium'): 'peaceful_exploration',
+    ('low', 'long'): 'peaceful_exploration'
+}
+
+_INTROS = {
+    'quick_calm': "Imagine you're stepping into a quiet garden sanctuary where stress melts away with each breath...",
+    'gentle_journey': "Picture yourself on a peaceful mountain path, where each step brings more clarity and calm...",
+    'deep_restoration': "Envision yourself in a healing forest grove, where ancient trees share their wisdom and tranquility...",
+    'peaceful_exploration': "See yourself floating on a serene lake at sunset, with infinite peace surrounding you..."
+}
+
+_WISDOM = {
+    'quick_calm': "Like a flower that blooms in moments, you've found peace in this brief sanctuary. Carry this calm with you.",
+    'gentle_journey': "Your inner mountain remains steady and strong. You can return to this peaceful path whenever you need.",
+    'deep_restoration': "The healing energy of the forest flows within you now. Trust in your body's natural wisdom to restore itself.",
+    'peaceful_exploration': "The vast peace of the lake lives within your heart. You are both the stillness and the infinite sky above."
+}
+
 
 def calculate_breathing_pattern(pattern_type: str) -> Dict[str, int]:
     """
@@ -22,14 +168,8 @@ def calculate_breathing_pattern(pattern_type: str) -> Dict[str, int]:
     Returns:
         Dict with 'inhale', 'hold', 'exhale' times in seconds
     """
-    patterns = {
-        '4-7-8': {'inhale': 4, 'hold': 7, 'exhale': 8},
-        'box': {'inhale': 4, 'hold': 4, 'exhale': 4},
-        'triangle': {'inhale': 4, 'hold': 0, 'exhale': 4},
-        'simple': {'inhale': 3, 'hold': 0, 'exhale': 3}
-    }
-    
-    return patterns.get(pattern_type, patterns['simple'])
+    # Copy so callers can't mutate the shared table
+    return dict(_PATTERNS.get(pattern_type, _SIMPLE_DEFAULT))
 
 
 def suggest_meditation_duration(experience_level: str, available_time: int) -> int:
@@ -43,11 +183,12 @@ def suggest_meditation_duration(experience_level: str, available_time: int) -> i
     Returns:
         Suggested duration in minutes
     """
-    # Coerce available_time to int if passed as string
-    try:
-        available_time = int(str(available_time).strip())
-    except Exception:
-        available_time = 10
+    # Coerce available_time to int if passed as string; ints pass straight through
+    if type(available_time) is not int:
+        try:
+            available_time = int(str(available_time).strip())
+        except Exception:
+            available_time = 10
 
     suggestions = {
         'beginner': min(available_time, 10),
@@ -71,36 +212,25 @@ def generate_mindfulness_prompt(focus_area: str) -> str:
     Returns:
         A mindfulness prompt string
     """
-    prompts = {
-        'breath': [
-            "Notice the natural rhythm of your breath. Feel the air flowing in and out.",
-            "Observe your breath without trying to change it. Simply be aware.",
-            "Feel the sensation of breathing in your nostrils and chest."
-        ],
-        'body': [
-            "Scan your body from head to toe, noticing any sensations.",
-            "Feel the weight of your body and how it's supported.",
-            "Notice areas of tension or relaxation in your body."
-        ],
-        'thoughts': [
-            "Observe your thoughts like clouds passing in the sky.",
-            "Notice thoughts arising and passing away without judgment.",
-            "When you notice thinking, gently return attention to the present."
-        ],
-        'emotions': [
-            "Notice any emotions present without trying to change them.",
-            "Breathe with whatever feelings are here right now.",
-            "Allow emotions to be as they are, with kindness."
-        ],
-        'gratitude': [
-            "Bring to mind something you're grateful for today.",
-            "Feel the warmth of appreciation in your heart.",
-            "Notice three things you appreciate about this moment."
-        ]
-    }
+    area_prompts = _PROMPTS.get(focus_area, _DEFAULT_PROMPTS)
+    return _choice(area_prompts)
+
+
+def generate_mindfulness_prompts_batch(focus_areas: List[str]) -> List[str]:
+    """
+    Generate one mindfulness prompt per focus area in a single call.
     
-    area_prompts = prompts.get(focus_area, prompts['breath'])
-    return random.choice(area_prompts)
+    Args:
+        focus_areas: List of focus areas, as accepted by generate_mindfulness_prompt
+        
+    Returns:
+        List of mindfulness prompt strings, in the same order as focus_areas
+    """
+    # Local names avoid a global lookup per area in the comprehension
+    prompts = _PROMPTS
+    default = _DEFAULT_PROMPTS
+    choice = _choice
+    return [choice(prompts.get(area, default)) for area in focus_areas]
 
 
 def assess_stress_level(responses: List[str]) -> str:
@@ -113,23 +243,15 @@ def assess_stress_level(responses: List[str]) -> str:
     Returns:
         Stress level: 'low', 'moderate', 'high'
     """
-    stress_indicators = {
-        'high': ['anxious', 'overwhelmed', 'stressed', 'panicked', 'racing', 'tense', 'worried'],
-        'moderate': ['busy', 'tired', 'restless', 'distracted', 'uncomfortable'],
-        'low': ['calm', 'peaceful', 'relaxed', 'content', 'balanced', 'centered']
-    }
-    
     response_text = ' '.join(responses).lower()
     
-    high_count = sum(1 for word in stress_indicators['high'] if word in response_text)
-    moderate_count = sum(1 for word in stress_indicators['moderate'] if word in response_text)
+    bits = 0
+    for match in _STRESS_PATTERN.finditer(response_text):
+        bits |= _STRESS_BITS[match.group(1)]
+        if bits & 2:
+            break
     
-    if high_count > 0:
-        return 'high'
-    elif moderate_count > 0:
-        return 'moderate'
-    else:
-        return 'low'
+    return _TIERS[bits]
 
 
 def create_personalized_affirmation(intention: str, name: str = "") -> str:
@@ -137,52 +259,22 @@ def create_personalized_affirmation(intention: str, name: str = "") -> str:
     Create a personalized affirmation based on intention.
     Always returns a friendly string, even on unexpected input.
     """
-    try:
-        intention_str = (intention or "").strip()
-        name_str = (name or "").strip()
-
-        affirmation_templates = {
-            'peace': "May {name}find deep peace and tranquility.",
-            'strength': "May {name}discover your inner strength and resilience.",
-            'clarity': "May {name}gain clarity and insight.",
-            'healing': "May {name}experience healing and renewal.",
-            'gratitude': "May {name}feel grateful for all the goodness in your life.",
-            'love': "May {name}feel love and compassion for yourself and others.",
-            'focus': "May {name}develop clear focus and concentration."
-        }
-
-        # Map common synonyms/phrases to template keys (covers 'heart' → love)
-        synonyms = {
-            'peace': ['peace', 'calm', 'relax', 'relaxed', 'tranquil', 'ease'],
-            'strength': ['strength', 'resilience', 'power', 'courage'],
-            'clarity': ['clarity', 'clear', 'insight', 'understand', 'focus'],
-            'healing': ['healing', 'heal', 'recover', 'renewal'],
-            'gratitude': ['gratitude', 'grateful', 'appreciation', 'appreciate'],
-            'love': ['love', 'heart', 'compassion', 'kindness', 'connection'],
-            'focus': ['focus', 'concentration', 'concentrate', 'attention']
-        }
-
-        intention_lower = intention_str.lower()
-        chosen_key = None
-        for key, words in synonyms.items():
-            if any(word in intention_lower for word in words):
-                chosen_key = key
-                break
-
-        name_part = f"{name_str}, " if name_str else ""
-
-        if chosen_key:
-            return affirmation_templates[chosen_key].format(name=name_part)
-
-        # Default affirmation
-        return f"May {name_part}find what you're seeking in this practice."
-    except Exception as e:
-        # Never fail silently; return a safe default
-        from loguru import logger
-        logger.debug(f"create_personalized_affirmation error: {e}")
-        name_str = (name or "").strip()
-        name_part = f"{name_str}, " if name_str else ""
-        return f"May {name_part}find what you're seeking in this practice."
+    # Coerce up front so unexpected input types can't raise below
+    intention_lower = str(intention or "").strip().lower()
+    name_str = str(name or "").strip()
+
+    # One scan finds every synonym in the intention; the highest-priority key wins
+    chosen_key = min(
+        (_SYNONYM_LOOKUP[word] for word in _SYNONYM_PATTERN.findall(intention_lower)),
+        key=_SYNONYM_PRIORITY.__getitem__,
+        default=None,
+    )
+
+    # Unmatched intentions get the default affirmation
+    prefix, suffix = _AFFIRM_PARTS.get(chosen_key, _DEFAULT_AFFIRM_PARTS)
+    if not name_str:
+        return prefix + suffix
+    return f"{prefix}{name_str}, {suffix}"
 
 
 def check_time_availability(available_time: str) -> str:
@@ -195,16 +287,21 @@ def check_time_availability(available_time: str) -> str:
     Returns:
         Category: 'short' (5-10 min), 'medium' (10-20 min), 'long' (20+ min)
     """
-    try:
-        time_int = int(str(available_time).strip())
-        if time_int <= 10:
+    # Ints pass straight through; anything else is parsed from its string form
+    if type(available_time) is int:
+        time_int = available_time
+    else:
+        try:
+            time_int = int(str(available_time).strip())
+        except Exception:
             return 'short'
-        elif time_int <= 20:
-            return 'medium'
-        else:
-            return 'long'
-    except Exception:
+    
+    if time_int <= 10:
         return 'short'
+    elif time_int <= 20:
+        return 'medium'
+    else:
+        return 'long'
 
 
 def determine_meditation_path(stress_level: str, available_time: str) -> str:
@@ -220,21 +317,10 @@ def determine_meditation_path(stress_level: str, available_time: str) -> str:
     """
     time_category = check_time_availability(available_time)
     
-    if stress_level == 'high':
-        if time_category == 'short':
-            return 'quick_calm'
-        else:
-            return 'deep_restoration'
-    elif stress_level == 'moderate':
-        if time_category in ['short', 'medium']:
-            return 'gentle_journey'
-        else:
-            return 'peaceful_exploration'
-    else:  # low stress
-        if time_category == 'short':
-            return 'gentle_journey'
-        else:
-            return 'peaceful_exploration'
+    path = _PATH_TABLE.get((stress_level, time_category))
+    if path is None:  # unknown stress levels are treated as low stress
+        path = _PATH_TABLE[('low', time_category)]
+    return path
 
 
 def get_story_introduction(meditation_path: str) -> str:
@@ -247,14 +333,7 @@ def get_story_introduction(meditation_path: str) -> str:
     Returns:
         A story introduction string
     """
-    introductions = {
-        'quick_calm': "Imagine you're stepping into a quiet garden sanctuary where stress melts away with each breath...",
-        'gentle_journey': "Picture yourself on a peaceful mountain path, where each step brings more clarity and calm...",
-        'deep_restoration': "Envision yourself in a healing forest grove, where ancient trees share their wisdom and tranquility...",
-        'peaceful_exploration': "See yourself floating on a serene lake at sunset, with infinite peace surrounding you..."
-    }
-    
-    return introductions.get(meditation_path, introductions['gentle_journey'])
+    return _INTROS.get(meditation_path, _INTROS['gentle_journey'])
 
 
 def get_final_wisdom(meditation_path: str) -> str:
@@ -267,14 +346,7 @@ def get_final_wisdom(meditation_path: str) -> str:
     Returns:
         Closing wisdom string
     """
-    wisdom = {
-        'quick_calm': "Like a flower that blooms in moments, you've found peace in this brief sanctuary. Carry this calm with you.",
-        'gentle_journey': "Your inner mountain remains steady and strong. You can return to this peaceful path whenever you need.",
-        'deep_restoration': "The healing energy of the forest flows within you now. Trust in your body's natural wisdom to restore itself.",
-        'peaceful_exploration': "The vast peace of the lake lives within your heart. You are both the stillness and the infinite sky above."
-    }
-    
-    return wisdom.get(meditation_path, wisdom['gentle_journey'])
+    return _WISDOM.get(meditation_path, _WISDOM['gentle_journey'])
 
 
 def register_meditation_tools(registry: ToolRegistry) -> None:
@@ -1,105 +1,128 @@
 """
 ACME Financial specific workflow tools with type hints.
 """
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from journey import ToolRegistry
 from loguru import logger
 
 
-def check_user_active_loans(user_id: str) -> Dict[str, Any]:
-    """Check if a user has active loans and return loan details."""
-    logger.debug(f"check_user_active_loans called with user_id: {user_id}")
-    
-    # Mock data for different users
-    mock_loan_data = {
-        "12345": {
-            "has_active_loans": True,
-            "active_loans": [
-                {
-                    "loan_id": "LOAN-001",
-                    "loan_type": "Personal Loan",
-                    "amount": 15000.00,
-                    "balance": 8500.00,
-                    "status": "Active",
-                    "monthly_payment": 450.00,
-                    "next_payment_date": "2025-01-15"
-                },
-                {
-                    "loan_id": "LOAN-002", 
-                    "loan_type": "Auto Loan",
-                    "amount": 25000.00,
-                    "balance": 18200.00,
-                    "status": "Active",
-                    "monthly_payment": 380.00,
-                    "next_payment_date": "2025-01-20"
-                }
-            ],
-            "total_balance": 26700.00
-        },
-        "67890": {
-            "has_active_loans": True,
-            "active_loans": [
-                {
-                    "loan_id": "LOAN-003",
-                    "loan_type": "Mortgage",
-                    "amount": 350000.00,
-                    "balance": 298000.00,
-                    "status": "Active",
-                    "monthly_payment": 1650.00,
-                    "next_payment_date": "2025-01-01"
-                }
-            ],
-            "total_balance": 298000.00
-        },
-        "11111": {
-            "has_active_loans": False,
-            "active_loans": [],
-            "total_balance": 0.00
-        }
-    }
-    
-    # Return mock data for known users, or default to no loans for unknown users
-    result = mock_loan_data.get(user_id, {
+# Mock data for different users
+_RAW_LOAN_DATA = {
+    "12345": {
+        "has_active_loans": True,
+        "active_loans": [
+            {
+                "loan_id": "LOAN-001",
+                "loan_type": "Personal Loan",
+                "amount": 15000.00,
+                "balance": 8500.00,
+                "status": "Active",
+                "monthly_payment": 450.00,
+                "next_payment_date": "2025-01-15"
+            },
+            {
+                "loan_id": "LOAN-002", 
+                "loan_type": "Auto Loan",
+                "amount": 25000.00,
+                "balance": 18200.00,
+                "status": "Active",
+                "monthly_payment": 380.00,
+                "next_payment_date": "2025-01-20"
+            }
+        ],
+        "total_balance": 26700.00
+    },
+    "67890": {
+        "has_active_loans": True,
+        "active_loans": [
+            {
+                "loan_id": "LOAN-003",
+                "loan_type": "Mortgage",
+                "amount": 350000.00,
+                "balance": 298000.00,
+                "status": "Active",
+                "monthly_payment": 1650.00,
+                "next_payment_date": "2025-01-01"
+            }
+        ],
+        "total_balance": 298000.00
+    },
+    "11111": {
         "has_active_loans": False,
         "active_loans": [],
         "total_balance": 0.00
+    }
+}
+
+
+def _freeze_loan_record(record: Dict[str, Any]) -> Mapping[str, Any]:
+    """Make a loan record read-only so it can be shared without copying."""
+    return MappingProxyType({
+        **record,
+        "active_loans": tuple(MappingProxyType(loan) for loan in record["active_loans"])
     })
+
+
+_MOCK_LOAN_DATA = MappingProxyType({
+    user_id: _freeze_loan_record(record) for user_id, record in _RAW_LOAN_DATA.items()
+})
+
+_DEFAULT_LOAN_RESULT = _freeze_loan_record({
+    "has_active_loans": False,
+    "active_loans": [],
+    "total_balance": 0.00
+})
+
+
+def _loan_record(user_id: str) -> Mapping[str, Any]:
+    """Return the frozen mock data for known users, or no loans for unknown users."""
+    return _MOCK_LOAN_DATA.get(user_id, _DEFAULT_LOAN_RESULT)
+
+
+def check_user_active_loans(user_id: str) -> Dict[str, Any]:
+    """Check if a user has active loans and return loan details."""
+    logger.debug("check_user_active_loans called with user_id: {}", user_id)
+    
+    # Plain copy: the result is stored in workflow variables and serialized to JSON
+    record = _loan_record(user_id)
+    result = {**record, "active_loans": [dict(loan) for loan in record["active_loans"]]}
     
-    logger.debug(f"check_user_active_loans returning: {result}")
+    logger.debug("check_user_active_loans returning: {}", result)
     return result
 
 
 def has_active_loans(user_id: str) -> bool:
     """Simple boolean check if user has any active loans."""
-    logger.debug(f"has_active_loans called with user_id: {user_id}")
+    logger.debug("has_active_loans called with user_id: {}", user_id)
     
-    loan_data = check_user_active_loans(user_id)
+    loan_data = _loan_record(user_id)
     result = loan_data.get("has_active_loans", False)
     
-    logger.debug(f"has_active_loans returning: {result}")
+    logger.debug("has_active_loans returning: {}", result)
     return result
 
 
 def get_loan_count(user_id: str) -> int:
     """Get the number of active loans for a user."""
-    logger.debug(f"get_loan_count called with user_id: {user_id}")
+    logger.debug("get_loan_count called with user_id: {}", user_id)
     
-    loan_data = check_user_active_loans(user_id)
+    loan_data = _loan_record(user_id)
     result = len(loan_data.get("active_loans", []))
     
-    logger.debug(f"get_loan_count returning: {result}")
+    logger.debug("get_loan_count returning: {}", result)
     return result
 
 
 def get_total_loan_balance(user_id: str) -> float:
     """Get the total outstanding balance across all active loans for a user."""
-    logger.debug(f"get_total_loan_balance called with user_id: {user_id}")
+    logger.debug("get_total_loan_balance called with user_id: {}", user_id)
     
-    loan_data = check_user_active_loans(user_id)
+    loan_data = _loan_record(user_id)
     result = loan_data.get("total_balance", 0.00)
     
-    logger.debug(f"get_total_loan_balance returning: {result}")
+    logger.debug("get_total_loan_balance returning: {}", result)
     return result
 
 
@@ -7,7 +7,7 @@ from .function_registry import (  # Legacy compatibility
     FunctionRegistry,
     execute_function_call,
 )
-from .orchestrator import Orchestrator
+from .orchestrator import Orchestrator, SessionState, WorkflowGraph
 from .tool_registry import ToolRegistry, execute_tool_call
 from .utils import interpolate_variables, parse_function_call
 
@@ -19,6 +19,8 @@ __all__ = [
     "FunctionRegistry",  # Legacy compatibility
     "execute_function_call",  # Legacy compatibility
     "Orchestrator",
+    "SessionState",
+    "WorkflowGraph",
     "interpolate_variables",
     "parse_function_call",
 ]
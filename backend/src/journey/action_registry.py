@@ -3,15 +3,22 @@ Action registry system for workflow control operations.
 Actions are the basic building blocks of workflows like SET_VARIABLE, PRESENT_CONTENT, etc.
 """
 import inspect
-from typing import Any, Callable, Dict, List, Optional, get_type_hints
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, get_type_hints
 
 from loguru import logger
-from pydantic import BaseModel, Field
 
-from .utils import interpolate_variables
+from .utils import get_type_string, interpolate_variables
 
+# Sentinel for parameters without a default; compared by identity
+_EMPTY = inspect.Parameter.empty
 
-class ActionArgument(BaseModel):
+
+# Internal registry records, only ever filled in by register(), so plain
+# slotted dataclasses rather than validated pydantic models
+@dataclass(slots=True, frozen=True)
+class ActionArgument:
     """Definition of an action argument with type information."""
     name: str
     type: str
@@ -20,15 +27,20 @@ class ActionArgument(BaseModel):
     description: Optional[str] = None
 
 
-class ActionDefinition(BaseModel):
+@dataclass(slots=True)
+class ActionDefinition:
     """Definition of a registered action with complete metadata."""
     id: str
     name: str
     description: str
-    arguments: List[ActionArgument]
+    arguments: Tuple[ActionArgument, ...]
     return_type: str
     category: str = "workflow"
-    examples: List[str] = Field(default_factory=list)
+    examples: Tuple[str, ...] = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dict, with arguments as nested dicts."""
+        return asdict(self)
 
 
 class ActionRegistry:
@@ -37,10 +49,14 @@ class ActionRegistry:
     def __init__(self):
         self.actions: Dict[str, Callable] = {}
         self.definitions: Dict[str, ActionDefinition] = {}
+        # Category -> definitions, kept in registration order alongside definitions
+        self._by_category: Dict[str, List[ActionDefinition]] = {}
         self._register_builtin_actions()
     
     def register(self, name: str, action: Callable, description: str = "", category: str = "workflow", examples: Optional[List[str]] = None):
         """Register an action with complete metadata extraction."""
+        # Interned so lookups with the same name can match on identity
+        name = sys.intern(name)
         self.actions[name] = action
         
         # Extract function signature and type hints
@@ -49,13 +65,14 @@ class ActionRegistry:
         
         arguments = []
         for param_name, param in sig.parameters.items():
-            param_type = type_hints.get(param_name, type(None))
+            # Unannotated parameters come back as None, which maps to "any"
+            param_type = type_hints.get(param_name)
             
             # Convert Python types to string representations
             type_str = self._get_type_string(param_type)
             
             # Check if parameter has default value
-            has_default = param.default != inspect.Parameter.empty
+            has_default = param.default is not _EMPTY
             default_value = param.default if has_default else None
             
             arg_def = ActionArgument(
@@ -68,7 +85,7 @@ class ActionRegistry:
             arguments.append(arg_def)
         
         # Get return type
-        return_type = type_hints.get('return', type(None))
+        return_type = type_hints.get('return')
         return_type_str = self._get_type_string(return_type)
         
         # Create action definition
@@ -76,43 +93,41 @@ class ActionRegistry:
             id=name,
             name=name,
             description=description or action.__doc__ or f"Action {name}",
-            arguments=arguments,
+            arguments=tuple(arguments),
             return_type=return_type_str,
             category=category,
-            examples=examples or []
+            examples=tuple(examples or ())
         )
         
+        previous = self.definitions.get(name)
+        if previous is not None and previous.category == category:
+            # Re-registration keeps the action's place in its category
+            bucket = self._by_category[category]
+            bucket[bucket.index(previous)] = action_def
+        else:
+            if previous is not None:
+                self._by_category[previous.category].remove(previous)
+            self._by_category.setdefault(category, []).append(action_def)
+        
         self.definitions[name] = action_def
-        logger.debug(f"Registered action: {name} with {len(arguments)} arguments")
+        logger.debug("Registered action: {} with {} arguments", name, len(arguments))
     
     def _get_type_string(self, type_hint: Any) -> str:
         """Convert Python type hints to string representations."""
-        if type_hint is type(None) or type_hint is None:
-            return "any"
-        elif type_hint == str:
-            return "string"
-        elif type_hint == int:
-            return "number"
-        elif type_hint == float:
-            return "number"
-        elif type_hint == bool:
-            return "boolean"
-        elif type_hint == list or (hasattr(type_hint, '__origin__') and type_hint.__origin__ == list):
-            return "array"
-        elif type_hint == dict or (hasattr(type_hint, '__origin__') and type_hint.__origin__ == dict):
-            return "object"
-        else:
-            return str(type_hint).replace('<class \'', '').replace('\'>', '').replace('typing.', '')
+        return get_type_string(type_hint)
     
     def execute(self, action_name: str, context: Dict[str, Any], **kwargs) -> Any:
         """Execute a registered action with context."""
-        if action_name not in self.actions:
-            logger.debug(f"Action '{action_name}' not found in registry")
-            raise ValueError(f"Action '{action_name}' not found in registry")
-        
-        logger.debug(f"Executing action: {action_name} with context: {context} and kwargs: {kwargs}")
-        result = self.actions[action_name](context, **kwargs)
-        logger.debug(f"Action {action_name} returned: {result}")
+        try:
+            action = self.actions[action_name]
+        except KeyError:
+            logger.debug("Action '{}' not found in registry", action_name)
+            raise ValueError(f"Action '{action_name}' not found in registry") from None
+        
+        # Deferred {} formatting: context and kwargs are only rendered if debug is on
+        logger.debug("Executing action: {} with context: {} and kwargs: {}", action_name, context, kwargs)
+        result = action(context, **kwargs)
+        logger.debug("Action {} returned: {}", action_name, result)
         return result
     
     def has_action(self, name: str) -> bool:
@@ -129,7 +144,7 @@ class ActionRegistry:
     
     def get_actions_by_category(self, category: str) -> List[ActionDefinition]:
         """Get actions filtered by category."""
-        return [action_def for action_def in self.definitions.values() if action_def.category == category]
+        return list(self._by_category.get(category, ()))
     
     def _register_builtin_actions(self):
         """Register the built-in workflow control actions."""
@@ -137,18 +152,18 @@ class ActionRegistry:
         def present_content(context: Dict[str, Any], payload: str) -> str:
             """Present content to the user with variable interpolation."""
             interpolated_payload = interpolate_variables(payload, context.get('variables', {}))
-            logger.debug(f"Presenting content: {interpolated_payload}")
+            logger.debug("Presenting content: {}", interpolated_payload)
             return interpolated_payload
         
         def await_user_input(context: Dict[str, Any], target: str = "") -> str:
             """Signal that user input is needed and should be stored in target variable."""
-            logger.debug(f"Awaiting user input for variable: {target}")
+            logger.debug("Awaiting user input for variable: {}", target)
             return f"AWAIT_INPUT:{target}"
         
         def set_variable(context: Dict[str, Any], target: str, value: str) -> Any:
             """Set a variable to a specific value with interpolation."""
             interpolated_value = interpolate_variables(value, context.get('variables', {}))
-            logger.debug(f"Setting variable {target} to: {interpolated_value}")
+            logger.debug("Setting variable {} to: {}", target, interpolated_value)
             context.setdefault('variables', {})[target] = interpolated_value
             return interpolated_value
         
@@ -158,21 +173,20 @@ class ActionRegistry:
             variables = context.setdefault('variables', {})
             
             if operation == "append":
-                if target not in variables:
-                    variables[target] = []
-                if isinstance(variables[target], list):
-                    variables[target].append(interpolated_value)
+                current = variables.setdefault(target, [])
+                if isinstance(current, list):
+                    current.append(interpolated_value)
                 else:
-                    variables[target] = [variables[target], interpolated_value]
+                    current = variables[target] = [current, interpolated_value]
             else:  # set operation
-                variables[target] = interpolated_value
+                current = variables[target] = interpolated_value
             
-            logger.debug(f"Updated variable {target} with operation {operation}: {variables[target]}")
-            return variables[target]
+            logger.debug("Updated variable {} with operation {}: {}", target, operation, current)
+            return current
         
         def goto_node(context: Dict[str, Any], target: str) -> str:
             """Signal navigation to another node."""
-            logger.debug(f"Navigating to node: {target}")
+            logger.debug("Navigating to node: {}", target)
             return f"GOTO_NODE:{target}"
         
         def end_workflow(context: Dict[str, Any]) -> str:
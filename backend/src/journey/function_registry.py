@@ -1,17 +1,21 @@
 """
 Generic function registry system for workflow functions with Pydantic support.
 """
+import functools
 import inspect
-from typing import Any, Callable, Dict, List, Optional, get_type_hints
+from typing import Any, Callable, Dict, List, Optional, Tuple, get_type_hints
 
 from loguru import logger
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from .utils import interpolate_variables, parse_function_call
+from .utils import get_type_string, interpolate_variables, parse_function_call
 
 
 class FunctionArgument(BaseModel):
     """Definition of a function argument with type information."""
+    # Frozen: _introspect shares the same instances across registrations
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     type: str
     default: Optional[Any] = None
@@ -30,6 +34,43 @@ class FunctionDefinition(BaseModel):
     examples: List[str] = Field(default_factory=list)
 
 
+@functools.lru_cache(maxsize=256)
+def _introspect(func: Callable) -> Tuple[Tuple[FunctionArgument, ...], str]:
+    """Build the argument definitions and return type string for a function.
+
+    Cached per function, so re-registering it reuses the same (shared, frozen)
+    FunctionArgument objects instead of re-running introspection and validation.
+    """
+    # Extract function signature and type hints
+    sig = inspect.signature(func)
+    type_hints = get_type_hints(func)
+    
+    arguments = []
+    for param_name, param in sig.parameters.items():
+        param_type = type_hints.get(param_name, type(None))
+        
+        # Convert Python types to string representations
+        type_str = get_type_string(param_type)
+        
+        # Check if parameter has default value
+        has_default = param.default is not inspect.Parameter.empty
+        default_value = param.default if has_default else None
+        
+        # Fields come straight from introspection, so skip pydantic validation
+        arg_def = FunctionArgument.model_construct(
+            name=param_name,
+            type=type_str,
+            default=default_value,
+            required=not has_default,
+            description=f"Parameter {param_name} of type {type_str}"
+        )
+        arguments.append(arg_def)
+    
+    # Get return type
+    return_type = type_hints.get('return', type(None))
+    return tuple(arguments), get_type_string(return_type)
+
+
 class FunctionRegistry:
     """Enhanced function registry with Pydantic support for workflow functions."""
     
@@ -41,40 +82,14 @@ class FunctionRegistry:
         """Register a function with complete metadata extraction."""
         self.functions[name] = func
         
-        # Extract function signature and type hints
-        sig = inspect.signature(func)
-        type_hints = get_type_hints(func)
-        
-        arguments = []
-        for param_name, param in sig.parameters.items():
-            param_type = type_hints.get(param_name, type(None))
-            
-            # Convert Python types to string representations
-            type_str = self._get_type_string(param_type)
-            
-            # Check if parameter has default value
-            has_default = param.default != inspect.Parameter.empty
-            default_value = param.default if has_default else None
-            
-            arg_def = FunctionArgument(
-                name=param_name,
-                type=type_str,
-                default=default_value,
-                required=not has_default,
-                description=f"Parameter {param_name} of type {type_str}"
-            )
-            arguments.append(arg_def)
-        
-        # Get return type
-        return_type = type_hints.get('return', type(None))
-        return_type_str = self._get_type_string(return_type)
+        arguments, return_type_str = _introspect(func)
         
         # Create function definition
-        func_def = FunctionDefinition(
+        func_def = FunctionDefinition.model_construct(
             id=name,
             name=name,
             description=description or func.__doc__ or f"Function {name}",
-            arguments=arguments,
+            arguments=list(arguments),
             return_type=return_type_str,
             category=category,
             examples=examples or []
@@ -85,22 +100,7 @@ class FunctionRegistry:
     
     def _get_type_string(self, type_hint: Any) -> str:
         """Convert Python type hints to string representations."""
-        if type_hint is type(None) or type_hint is None:
-            return "any"
-        elif type_hint == str:
-            return "string"
-        elif type_hint == int:
-            return "number"
-        elif type_hint == float:
-            return "number"
-        elif type_hint == bool:
-            return "boolean"
-        elif type_hint == list or (hasattr(type_hint, '__origin__') and type_hint.__origin__ == list):
-            return "array"
-        elif type_hint == dict or (hasattr(type_hint, '__origin__') and type_hint.__origin__ == dict):
-            return "object"
-        else:
-            return str(type_hint).replace('<class \'', '').replace('\'>', '').replace('typing.', '')
+        return get_type_string(type_hint)
     
     def call(self, name: str, *args, **kwargs) -> Any:
         """Call a registered function."""
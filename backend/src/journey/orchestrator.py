@@ -1,12 +1,356 @@
 """
 Workflow orchestrator for managing declarative YAML-based workflows.
 """
-from typing import Any, Dict, List, Optional
+import ast
+import contextlib
+import functools
+import itertools
+import os
+import re
+import secrets
+import sys
+from dataclasses import dataclass, field
+from operator import eq, ge, gt, is_, is_not, le, lt, ne
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import yaml
 from loguru import logger
 
-from .utils import interpolate_variables
+from .utils import compile_template, interpolate_variables, render_template
+
+# Prefer the libyaml C loader; fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# A string that is exactly one placeholder like "{I Chain}"; surrounding
+# whitespace is allowed, so there is no need to strip() a copy first
+_SINGLE_VAR_RE = re.compile(r'\s*\{([\w\s]+)\}\s*')
+
+# Source of AWAIT_USER_INPUT ids: a random per-process prefix keeps them
+# unique across restarts and workers, the counter within this process
+_action_id_prefix = secrets.token_hex(4)
+_action_counter = itertools.count()
+
+# JS-style booleans in an interpolated condition -> their Python spelling
+_JS_BOOLEANS = (
+    ('== true', '== True'),
+    ('== false', '== False'),
+    (' true', ' True'),
+    (' false', ' False'),
+)
+
+# Comparison nodes allowed in condition strings -> the Python comparison
+_CONDITION_COMPARISONS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Eq: eq,
+    ast.NotEq: ne,
+    ast.Lt: lt,
+    ast.LtE: le,
+    ast.Gt: gt,
+    ast.GtE: ge,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+    ast.Is: is_,
+    ast.IsNot: is_not,
+}
+
+# Everything else a condition string may contain: literals, and/or/not and signs
+_CONDITION_NODES = (
+    ast.Expression, ast.Compare, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp,
+    ast.Not, ast.USub, ast.UAdd, ast.Constant, ast.Tuple, ast.List, ast.Set,
+    ast.Load, *_CONDITION_COMPARISONS,
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_condition(condition: str) -> ast.expr:
+    """Parse an interpolated condition, allowing only literals, comparisons and boolean logic.
+
+    Raises SyntaxError or ValueError for anything outside that grammar.
+    Interpolated conditions repeat across sessions, so each is parsed once.
+    """
+    tree = ast.parse(condition.strip(), mode='eval')
+    for node in ast.walk(tree):
+        if not isinstance(node, _CONDITION_NODES):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")
+    return tree.body
+
+
+def _eval_condition(node: ast.expr) -> Any:
+    """Evaluate a tree from _parse_condition with the same semantics as Python's eval()."""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Compare):
+        left = _eval_condition(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _eval_condition(comparator)
+            result = _CONDITION_COMPARISONS[type(op)](left, right)
+            if not result:
+                return result
+            left = right
+        return result
+    if isinstance(node, ast.BoolOp):
+        # Short-circuits and returns the deciding operand, as and/or do
+        stop_on = isinstance(node.op, ast.Or)
+        for value in node.values:
+            result = _eval_condition(value)
+            if bool(result) is stop_on:
+                break
+        return result
+    if isinstance(node, ast.UnaryOp):
+        operand = _eval_condition(node.operand)
+        if isinstance(node.op, ast.Not):
+            return not operand
+        return -operand if isinstance(node.op, ast.USub) else +operand
+    if isinstance(node, ast.Set):
+        return {_eval_condition(elt) for elt in node.elts}
+    elements = [_eval_condition(elt) for elt in node.elts]
+    return tuple(elements) if isinstance(node, ast.Tuple) else elements
+
+
+class _Operand(NamedTuple):
+    """A condition's comparison value with its case-folded and numeric forms."""
+    raw: Any
+    lower: str
+    number: Optional[float]
+
+
+def _operand(value: Any) -> _Operand:
+    """Precompute the forms of a static condition value the operators compare against."""
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        number = None
+    return _Operand(value, str(value).lower(), number)
+
+
+def _action_templates(action: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """(key, compiled template) for each field of an action holding {Variable} placeholders."""
+    # SET_VARIABLE's function name stays as written; its actionArgs are
+    # interpolated separately with type preservation
+    skip = ('action', 'actionArgs') if action.get('type') == 'SET_VARIABLE' else ()
+    templates = []
+    for key, value in action.items():
+        if key not in skip and isinstance(value, str) and '{' in value:
+            segments = compile_template(value)
+            if segments:
+                templates.append((key, segments))
+    return tuple(templates)
+
+
+def _mark_templates(value: Any, needs_interp: Dict[int, bool]) -> bool:
+    """Record for every dict/list in value whether a string inside it may hold a placeholder."""
+    if isinstance(value, dict):
+        children = value.values()
+    elif isinstance(value, list):
+        children = value
+    else:
+        return isinstance(value, str) and '{' in value
+    found = False
+    for child in children:
+        # Visit every child so nested containers are all recorded
+        found = _mark_templates(child, needs_interp) or found
+    needs_interp[id(value)] = found
+    return found
+
+
+def _lower(value: Any) -> str:
+    return str(value).lower()
+
+
+def _numeric(compare: Callable[[float, float], bool]) -> Callable[[Any, _Operand], bool]:
+    """Wrap a float comparison; values that are not numbers never match."""
+    def op(variable_value: Any, operand: _Operand) -> bool:
+        if operand.number is None:
+            return False
+        try:
+            return compare(float(variable_value), operand.number)
+        except (ValueError, TypeError):
+            return False
+    return op
+
+
+def _equals(variable_value: Any, operand: _Operand) -> bool:
+    return _lower(variable_value) == operand.lower
+
+
+def _not_equals(variable_value: Any, operand: _Operand) -> bool:
+    return _lower(variable_value) != operand.lower
+
+
+# Structured condition operator -> comparison of (variable value, rule operand).
+# String operators compare case-insensitively.
+_OPS: Dict[str, Callable[[Any, _Operand], bool]] = {
+    'equals': _equals,
+    '==': _equals,
+    'not_equals': _not_equals,
+    '!=': _not_equals,
+    'is_true': lambda variable_value, operand: variable_value is True or _lower(variable_value) == 'true',
+    'is_false': lambda variable_value, operand: variable_value is False or _lower(variable_value) == 'false',
+    'contains': lambda variable_value, operand: operand.lower in _lower(variable_value),
+    'starts_with': lambda variable_value, operand: _lower(variable_value).startswith(operand.lower),
+    'ends_with': lambda variable_value, operand: _lower(variable_value).endswith(operand.lower),
+    'greater_than': _numeric(gt),
+    'less_than': _numeric(lt),
+    'greater_than_or_equal': _numeric(ge),
+    'less_than_or_equal': _numeric(le),
+}
+
+
+def _compare(variable_value: Any, operator: str, operand: _Operand) -> bool:
+    """Apply a structured condition operator to a variable value."""
+    op = _OPS.get(operator)
+    if op is None:
+        logger.debug("Unknown operator: {}", operator)
+        return False
+    return op(variable_value, operand)
+
+
+@dataclass(slots=True, frozen=True)
+class WorkflowGraph:
+    """
+    The static, session-independent part of a workflow: its nodes plus the
+    lookup tables precomputed from them. Built once per workflow file and
+    shared by every Orchestrator and session using it, so it is never modified.
+    """
+    workflow: Dict[str, Any]
+    nodes: Dict[str, Dict[str, Any]]
+    node_order: Tuple[str, ...]
+    # Node ID -> ID of the node after it; the last node has no entry
+    next_node: Dict[str, str]
+    # Every node's blocks laid end to end in workflow order, with their
+    # (interned) types alongside; a node's blocks are blocks[start:end]
+    blocks: Tuple[Dict[str, Any], ...]
+    block_types: Tuple[str, ...]
+    node_ranges: Dict[str, Tuple[int, int]]
+    # id(action dict) -> (key, compiled template) for each field to interpolate,
+    # for every block and condition branch action
+    action_templates: Dict[int, Tuple[Tuple[str, Any], ...]]
+    # id(dict/list inside actionArgs) -> whether it holds any placeholder
+    needs_interp: Dict[int, bool]
+    # id(condition rule) -> its value, case-folded and converted up front
+    rule_operands: Dict[int, _Operand]
+
+    @classmethod
+    def from_workflow(cls, workflow: Dict[str, Any]) -> 'WorkflowGraph':
+        """Build the graph for a parsed workflow definition."""
+        nodes = {node['id']: node for node in workflow['nodes']}
+        node_order = tuple(node['id'] for node in workflow['nodes'])
+        
+        blocks: List[Dict[str, Any]] = []
+        node_ranges: Dict[str, Tuple[int, int]] = {}
+        for node in workflow['nodes']:
+            start = len(blocks)
+            blocks.extend(node['blocks'])
+            node_ranges[node['id']] = (start, len(blocks))
+        
+        action_templates: Dict[int, Tuple[Tuple[str, Any], ...]] = {}
+        needs_interp: Dict[int, bool] = {}
+        rule_operands: Dict[int, _Operand] = {}
+        
+        def index_action(action: Dict[str, Any]) -> None:
+            action_templates[id(action)] = _action_templates(action)
+            if 'actionArgs' in action:
+                _mark_templates(action['actionArgs'], needs_interp)
+        
+        for block in blocks:
+            if block['type'] == 'CONDITION':
+                for rule in block['rules']:
+                    rule_operands[id(rule)] = _operand(rule.get('value', ''))
+                    for action in (*rule.get('then', ()), *rule.get('else', ())):
+                        index_action(action)
+            else:
+                index_action(block)
+        
+        return cls(
+            workflow=workflow,
+            nodes=nodes,
+            node_order=node_order,
+            next_node=dict(zip(node_order, node_order[1:])),
+            blocks=tuple(blocks),
+            block_types=tuple(sys.intern(block['type']) for block in blocks),
+            node_ranges=node_ranges,
+            action_templates=action_templates,
+            needs_interp=needs_interp,
+            rule_operands=rule_operands,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'WorkflowGraph':
+        """Load a workflow file, reusing the graph while the file is unchanged."""
+        # Keyed on mtime so an edited file is re-read instead of served stale
+        return _load_graph(path, os.stat(path).st_mtime_ns)
+
+    def __reduce__(self):
+        # The id()-keyed tables are meaningless in another process, so a
+        # pickled graph is rebuilt from its workflow definition
+        return (WorkflowGraph.from_workflow, (self.workflow,))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_graph(path: str, mtime_ns: int) -> WorkflowGraph:
+    """Parse a workflow file and build its graph, once per path and modification time."""
+    with open(path, 'rb') as f:
+        return WorkflowGraph.from_workflow(yaml.load(f, Loader=_SafeLoader))
+
+
+@dataclass(slots=True)
+class SessionState:
+    """Per-session progress through a workflow: position, variables and the pending input."""
+    current_node_id: Optional[str] = None
+    current_block_index: int = 0
+    variables: Dict[str, Any] = field(default_factory=dict)
+    pending_action: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SessionState':
+        """Build from the session dict used at the API boundary; variables are shared, not copied."""
+        variables = data.get('variables')
+        return cls(
+            current_node_id=data.get('current_node_id'),
+            current_block_index=data.get('current_block_index', 0),
+            variables={} if variables is None else variables,
+            pending_action=data.get('pending_action'),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the session dict used at the API boundary.
+
+        Like pending_action, variables are left out until there are any, so
+        a session that never set one keeps the same shape as before.
+        """
+        data = {
+            'current_node_id': self.current_node_id,
+            'current_block_index': self.current_block_index,
+        }
+        if self.variables:
+            data['variables'] = self.variables
+        if self.pending_action is not None:
+            data['pending_action'] = self.pending_action
+        return data
+
+
+@contextlib.contextmanager
+def _session_scope(session_state: Union[Dict[str, Any], SessionState]) -> Iterator[SessionState]:
+    """Work on a SessionState, writing changes back when the caller passed a plain dict."""
+    if isinstance(session_state, SessionState):
+        yield session_state
+        return
+    state = SessionState.from_dict(session_state)
+    try:
+        yield state
+    finally:
+        session_state.update(state.to_dict())
+        if state.pending_action is None:
+            session_state.pop('pending_action', None)
+
+
+def _session_variables(session_state: Union[Dict[str, Any], SessionState]) -> Dict[str, Any]:
+    """The variables dict of a session, created if missing."""
+    if isinstance(session_state, SessionState):
+        return session_state.variables
+    return session_state.setdefault('variables', {})
 
 
 class Orchestrator:
@@ -15,78 +359,88 @@ class Orchestrator:
     It reads a declarative YAML file and determines the sequence of actions
     for the client to execute.
     """
-    def __init__(self, workflow_definition_path: str, action_registry=None, tool_registry=None):
+    def __init__(self, workflow_definition_path: Union[str, WorkflowGraph], action_registry=None, tool_registry=None):
         """
         Initializes the orchestrator by loading the workflow definition.
+        Accepts a path to the workflow file or an already loaded WorkflowGraph.
         """
-        with open(workflow_definition_path, 'r', encoding='utf-8') as f:
-            self.workflow = yaml.safe_load(f)
-        self.nodes = {node['id']: node for node in self.workflow['nodes']}
-        # Create an ordered list of node IDs for sequential navigation
-        self.node_order = [node['id'] for node in self.workflow['nodes']]
+        # Static workflow data, shared with every other orchestrator for the same file
+        if isinstance(workflow_definition_path, WorkflowGraph):
+            self.graph = workflow_definition_path
+        else:
+            self.graph = WorkflowGraph.load(workflow_definition_path)
+        self.workflow = self.graph.workflow
+        self.nodes = self.graph.nodes
+        # Ordered node IDs for sequential navigation
+        self.node_order = self.graph.node_order
         
         # Store registries for action execution and tool calls
         self.action_registry = action_registry
         self.tool_registry = tool_registry
         
-        logger.debug(f"Loaded workflow with nodes: {list(self.nodes.keys())}")
-        logger.debug(f"Node order: {self.node_order}")
+        # Action type -> handler, bound once instead of walking an if/elif chain per action
+        self._action_handlers = {
+            'SET_VARIABLE': self._handle_set_variable,
+            'UPDATE_VARIABLE': self._handle_update_variable,
+            'ANALYZE_RESPONSE': self._handle_analyze_response,
+            'PRESENT_CONTENT': self._handle_passthrough,
+            'AWAIT_USER_INPUT': self._handle_await_user_input,
+            'END_WORKFLOW': self._handle_passthrough,
+        }
+        
+        logger.opt(lazy=True).debug("Loaded workflow with nodes: {}", lambda: list(self.nodes.keys()))
+        logger.debug("Node order: {}", self.node_order)
         if action_registry:
-            logger.debug(f"Action registry loaded with {len(action_registry.list_actions())} actions")
+            logger.opt(lazy=True).debug("Action registry loaded with {} actions", lambda: len(action_registry.list_actions()))
         if tool_registry:
-            logger.debug(f"Tool registry loaded with {len(tool_registry.list_tools())} tools")
+            logger.opt(lazy=True).debug("Tool registry loaded with {} tools", lambda: len(tool_registry.list_tools()))
 
-    def get_variable(self, session_state: Dict[str, Any], var_name: str, default: Any = None) -> Any:
+    def get_variable(self, session_state: Union[Dict[str, Any], SessionState], var_name: str, default: Any = None) -> Any:
         """Get a variable value from the session state."""
-        variables = session_state.get('variables', {})
-        return variables.get(var_name, default)
+        if isinstance(session_state, SessionState):
+            return session_state.variables.get(var_name, default)
+        variables = session_state.get('variables')
+        return default if variables is None else variables.get(var_name, default)
 
-    def set_variable(self, session_state: Dict[str, Any], var_name: str, value: Any) -> None:
+    def set_variable(self, session_state: Union[Dict[str, Any], SessionState], var_name: str, value: Any) -> None:
         """Set a variable value in the session state."""
-        if 'variables' not in session_state:
-            session_state['variables'] = {}
-        
-        logger.debug(f"Setting variable '{var_name}' to '{value}'")
-        session_state['variables'][var_name] = value
+        logger.debug("Setting variable '{}' to '{}'", var_name, value)
+        _session_variables(session_state)[var_name] = value
 
-    def set_variable_from_source(self, session_state: Dict[str, Any], var_name: str, source: str) -> None:
+    def set_variable_from_source(self, session_state: Union[Dict[str, Any], SessionState], var_name: str, source: str) -> None:
         """
         Set a variable value from a source, which can be either a direct value or a tool call.
         """
         from .tool_registry import execute_tool_call
         
-        logger.debug(f"SET_VARIABLE: {var_name} = {source}")
+        logger.debug("SET_VARIABLE: {} = {}", var_name, source)
         
         # Try to execute as tool call first
         if self.tool_registry:
-            result = execute_tool_call(source, session_state.get('variables', {}), self.tool_registry)
+            result = execute_tool_call(source, _session_variables(session_state), self.tool_registry)
             if result is not None:
                 self.set_variable(session_state, var_name, result)
-                logger.debug(f"Variable '{var_name}' set to function result: {result}")
+                logger.debug("Variable '{}' set to function result: {}", var_name, result)
                 return
         
         # Fallback to direct assignment
         self.set_variable(session_state, var_name, source)
-        logger.debug(f"Variable '{var_name}' set to direct value: {source}")
+        logger.debug("Variable '{}' set to direct value: {}", var_name, source)
 
-    def update_variable(self, session_state: Dict[str, Any], target_var: str, source_var: str, operation: str) -> None:
+    def update_variable(self, session_state: Union[Dict[str, Any], SessionState], target_var: str, source_var: str, operation: str) -> None:
         """Update a variable using the specified operation."""
-        logger.debug(f"UPDATE_VARIABLE: {operation} '{source_var}' to '{target_var}'")
-        
-        if 'variables' not in session_state:
-            session_state['variables'] = {}
+        logger.debug("UPDATE_VARIABLE: {} '{}' to '{}'", operation, source_var, target_var)
         
         if operation == 'append':
-            if target_var not in session_state['variables']:
-                session_state['variables'][target_var] = []
-            session_state['variables'][target_var].append(source_var)
-            logger.debug(f"Appended '{source_var}' to '{target_var}': {session_state['variables'][target_var]}")
+            values = _session_variables(session_state).setdefault(target_var, [])
+            values.append(source_var)
+            logger.debug("Appended '{}' to '{}': {}", source_var, target_var, values)
         else:
-            logger.debug(f"Unknown operation: {operation}")
+            logger.debug("Unknown operation: {}", operation)
 
-    def analyze_and_set_variable(self, session_state: Dict[str, Any], input_val: str, output_var: str, criteria: Optional[str] = None) -> None:
+    def analyze_and_set_variable(self, session_state: Union[Dict[str, Any], SessionState], input_val: str, output_var: str, criteria: Optional[str] = None) -> None:
         """Analyze input and set a boolean variable based on the analysis."""
-        logger.debug(f"ANALYZE_RESPONSE: analyzing '{input_val}' with criteria '{criteria}'")
+        logger.debug("ANALYZE_RESPONSE: analyzing '{}' with criteria '{}'", input_val, criteria)
 
         # Use tool registry for analysis
         result = False
@@ -94,36 +448,35 @@ class Orchestrator:
             result = self.tool_registry.call(criteria, input_val)
         
         self.set_variable(session_state, output_var, result)
-        logger.debug(f"Analysis result: '{output_var}' = {result}")
+        logger.debug("Analysis result: '{}' = {}", output_var, result)
 
     def _evaluate_condition(self, condition_str: str, variables: Dict[str, Any]) -> bool:
         """
         Evaluates a simple condition string from the YAML file.
         Example: "{Is New Outcome Provided} == true"
         """
-        logger.debug(f"Evaluating condition: '{condition_str}' with variables: {variables}")
+        logger.debug("Evaluating condition: '{}' with variables: {}", condition_str, variables)
         
-        # Interpolate variables first
+        # Interpolate variables first, then spell JS-style booleans the Python way
         interpolated_condition = interpolate_variables(condition_str, variables)
-        logger.debug(f"After interpolation: '{interpolated_condition}'")
+        for js_literal, py_literal in _JS_BOOLEANS:
+            interpolated_condition = interpolated_condition.replace(js_literal, py_literal)
+        logger.debug("After interpolation: '{}'", interpolated_condition)
         
-        # Replace JS-style booleans with Python booleans for eval
-        interpolated_condition = (
-            interpolated_condition.replace('== true', '== True')
-            .replace('== false', '== False')
-            .replace(' true', ' True')
-            .replace(' false', ' False')
-        )
-        logger.debug(f"After boolean replacement: '{interpolated_condition}'")
+        # Parsed into a restricted expression tree and never eval()'d, so
+        # workflow files cannot run arbitrary code
+        try:
+            tree = _parse_condition(interpolated_condition)
+        except (SyntaxError, ValueError) as e:
+            logger.warning("Unsupported condition '{}' (interpolated: '{}'): {}", condition_str, interpolated_condition, e)
+            return False
         
         try:
-            # Note: Using eval() is a security risk in production with untrusted input.
-            # This is safe here as we control the YAML content.
-            result = eval(interpolated_condition)
-            logger.debug(f"Condition evaluation result: {result}")
+            result = _eval_condition(tree)
+            logger.debug("Condition evaluation result: {}", result)
             return result
         except Exception as e:
-            logger.debug(f"Error evaluating condition: {e}")
+            logger.debug("Error evaluating condition: {}", e)
             return False
 
     def _interpolate_with_types(self, value: Any, variables: Dict[str, Any]) -> Any:
@@ -136,12 +489,11 @@ class Orchestrator:
             return value
             
         # Check if the entire string is a single variable placeholder like "{I Chain}"
-        import re
-        single_var_match = re.match(r'^\{([\w\s]+)\}$', value.strip())
+        single_var_match = _SINGLE_VAR_RE.fullmatch(value)
         if single_var_match:
             var_name = single_var_match.group(1)
             if var_name in variables:
-                logger.debug(f"Returning original data type for variable '{var_name}': {type(variables[var_name])}")
+                logger.debug("Returning original data type for variable '{}': {}", var_name, type(variables[var_name]))
                 return variables[var_name]
         
         # For mixed strings or strings with multiple variables, use regular interpolation
@@ -149,6 +501,9 @@ class Orchestrator:
 
     def _interpolate_args_deep(self, value: Any, variables: Dict[str, Any]) -> Any:
         """Recursively interpolate variables inside dicts/lists while preserving types for strings."""
+        # Workflow containers known to hold no placeholders are returned as they are
+        if not self.graph.needs_interp.get(id(value), True):
+            return value
         if isinstance(value, dict):
             return {k: self._interpolate_args_deep(v, variables) for k, v in value.items()}
         if isinstance(value, list):
@@ -162,133 +517,112 @@ class Orchestrator:
         """
         variable = rule.get('variable', '')
         operator = rule.get('operator', 'equals')
-        value = rule.get('value', '')
+        # Workflow rules have their value prepared at load; others are prepared here
+        operand = self.graph.rule_operands.get(id(rule))
+        if operand is None:
+            operand = _operand(rule.get('value', ''))
+        value = operand.raw
         
-        logger.debug(f"Evaluating structured condition: variable='{variable}', operator='{operator}', value='{value}'")
+        logger.debug("Evaluating structured condition: variable='{}', operator='{}', value='{}'", variable, operator, value)
         
         # Get the variable value
         variable_value = variables.get(variable, '')
-        logger.debug(f"Variable '{variable}' has value: '{variable_value}'")
+        logger.debug("Variable '{}' has value: '{}'", variable, variable_value)
         
         # Evaluate based on operator
         try:
-            if operator == 'equals' or operator == '==':
-                result = str(variable_value).lower() == str(value).lower()
-            elif operator == 'not_equals' or operator == '!=':
-                result = str(variable_value).lower() != str(value).lower()
-            elif operator == 'is_true':
-                result = variable_value is True or str(variable_value).lower() == 'true'
-            elif operator == 'is_false':
-                result = variable_value is False or str(variable_value).lower() == 'false'
-            elif operator == 'contains':
-                result = str(value).lower() in str(variable_value).lower()
-            elif operator == 'starts_with':
-                result = str(variable_value).lower().startswith(str(value).lower())
-            elif operator == 'ends_with':
-                result = str(variable_value).lower().endswith(str(value).lower())
-            elif operator == 'greater_than':
-                try:
-                    result = float(variable_value) > float(value)
-                except (ValueError, TypeError):
-                    result = False
-            elif operator == 'less_than':
-                try:
-                    result = float(variable_value) < float(value)
-                except (ValueError, TypeError):
-                    result = False
-            elif operator == 'greater_than_or_equal':
-                try:
-                    result = float(variable_value) >= float(value)
-                except (ValueError, TypeError):
-                    result = False
-            elif operator == 'less_than_or_equal':
-                try:
-                    result = float(variable_value) <= float(value)
-                except (ValueError, TypeError):
-                    result = False
-            else:
-                logger.debug(f"Unknown operator: {operator}")
-                result = False
-            
-            logger.debug(f"Structured condition evaluation result: {result}")
+            result = _compare(variable_value, operator, operand)
+            logger.debug("Structured condition evaluation result: {}", result)
             return result
         except Exception as e:
-            logger.debug(f"Error evaluating structured condition: {e}")
+            logger.debug("Error evaluating structured condition: {}", e)
             return False
 
-    def get_next_step(self, session_state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def get_next_step(self, session_state: Union[Dict[str, Any], SessionState]) -> List[Dict[str, Any]]:
         """
         The main public method, simulating the `/getNextActions` API endpoint.
+        Returned actions are shallow copies; nested values such as lists in
+        actionArgs still belong to the shared workflow and must not be mutated.
         """
-        current_node_id = session_state.get('current_node_id')
-        current_block_index = session_state.get('current_block_index', 0)
-        variables = session_state.get('variables', {})
-        logger.debug("\n=== GET_NEXT_STEP ===")
-        logger.debug(f"Current node: {current_node_id}")
-        logger.debug(f"Current block index: {current_block_index}")
-        logger.debug(f"Variables: {variables}")
-
-        if not current_node_id:
-            logger.debug("No current node, starting with first node")
-            session_state['current_node_id'] = self.node_order[0]
-            session_state['current_block_index'] = 0
-            return self.get_next_step(session_state)
-
-        node = self.nodes.get(current_node_id)
-        if not node:
-            logger.debug(f"Node '{current_node_id}' not found!")
-            return [{'type': 'END_WORKFLOW'}]
+        with _session_scope(session_state) as state:
+            return self._get_next_step(state)
+
+    def _get_next_step(self, state: SessionState) -> List[Dict[str, Any]]:
+        """Advance to the next block with actions and process them."""
+        graph = self.graph
+        # Bound once; actions below update this same dict in place
+        variables = state.variables
+        
+        # Skip over node boundaries and condition blocks with no actions until
+        # a block yields something to do; state is re-read on every pass
+        while True:
+            current_node_id = state.current_node_id
+            current_block_index = state.current_block_index
+            logger.debug("\n=== GET_NEXT_STEP ===")
+            logger.debug("Current node: {}", current_node_id)
+            logger.debug("Current block index: {}", current_block_index)
+            logger.debug("Variables: {}", variables)
+
+            if not current_node_id:
+                logger.debug("No current node, starting with first node")
+                state.current_node_id = self.node_order[0]
+                state.current_block_index = 0
+                continue
+
+            node_range = graph.node_ranges.get(current_node_id)
+            if node_range is None:
+                logger.debug("Node '{}' not found!", current_node_id)
+                return [{'type': 'END_WORKFLOW'}]
             
-        logger.debug(f"Node '{current_node_id}' has {len(node['blocks'])} blocks")
+            start, end = node_range
+            block_count = end - start
+            logger.debug("Node '{}' has {} blocks", current_node_id, block_count)
         
-        if current_block_index >= len(node['blocks']):
-            logger.debug(f"Block index {current_block_index} >= {len(node['blocks'])}, moving to next node")
-            try:
-                current_node_index = self.node_order.index(current_node_id)
-                if current_node_index + 1 < len(self.node_order):
-                    next_node_id = self.node_order[current_node_index + 1]
-                    logger.debug(f"Moving to next node: {next_node_id}")
-                    session_state['current_node_id'] = next_node_id
-                    session_state['current_block_index'] = 0
-                    return self.get_next_step(session_state)
+            if current_block_index >= block_count:
+                logger.debug("Block index {} >= {}, moving to next node", current_block_index, block_count)
+                next_node_id = graph.next_node.get(current_node_id)
+                if next_node_id is not None:
+                    logger.debug("Moving to next node: {}", next_node_id)
+                    state.current_node_id = next_node_id
+                    state.current_block_index = 0
+                    continue
                 else:
                     logger.debug("No more nodes, ending workflow")
                     return [{'type': 'END_WORKFLOW'}]
-            except ValueError:
-                logger.debug(f"Current node '{current_node_id}' not found in node order")
-                return [{'type': 'END_WORKFLOW'}]
 
-        block = node['blocks'][current_block_index]
-        logger.debug(f"Processing block {current_block_index}: {block}")
-        actions_to_perform = []
-
-        if block['type'] == 'CONDITION':
-            logger.debug("Processing CONDITION block")
-            for i, rule in enumerate(block['rules']):
-                logger.debug(f"Evaluating rule {i}: {rule}")
-                condition_result = self._evaluate_structured_condition(rule, variables)
-                if condition_result:
-                    logger.debug(f"Rule {i} condition is True, executing 'then' actions")
-                    actions_to_perform.extend(rule.get('then', []))
-                    break
-            else:
-                final_rule = block['rules'][-1]
-                if 'else' in final_rule:
-                    logger.debug("No conditions matched, executing 'else' actions")
-                    actions_to_perform.extend(final_rule.get('else', []))
+            block = graph.blocks[start + current_block_index]
+            block_type = graph.block_types[start + current_block_index]
+            logger.debug("Processing block {}: {}", current_block_index, block)
+            actions_to_perform = []
+
+            if block_type == 'CONDITION':
+                logger.debug("Processing CONDITION block")
+                for i, rule in enumerate(block['rules']):
+                    logger.debug("Evaluating rule {}: {}", i, rule)
+                    condition_result = self._evaluate_structured_condition(rule, variables)
+                    if condition_result:
+                        logger.debug("Rule {} condition is True, executing 'then' actions", i)
+                        actions_to_perform.extend(rule.get('then', []))
+                        break
                 else:
-                    logger.debug("No conditions matched and no 'else' clause")
+                    final_rule = block['rules'][-1]
+                    if 'else' in final_rule:
+                        logger.debug("No conditions matched, executing 'else' actions")
+                        actions_to_perform.extend(final_rule.get('else', []))
+                    else:
+                        logger.debug("No conditions matched and no 'else' clause")
             
-            # --- FIX: If no actions, skip to next block ---
-            if not actions_to_perform:
-                logger.debug("No actions to perform, moving to next block")
-                session_state['current_block_index'] += 1
-                return self.get_next_step(session_state)
-        else:
-            logger.debug(f"Processing regular block of type: {block['type']}")
-            actions_to_perform.append(block)
+                # --- FIX: If no actions, skip to next block ---
+                if not actions_to_perform:
+                    logger.debug("No actions to perform, moving to next block")
+                    state.current_block_index += 1
+                    continue
+            else:
+                logger.debug("Processing regular block of type: {}", block_type)
+                actions_to_perform.append(block)
+            break
         
-        logger.debug(f"Actions to perform: {actions_to_perform}")
+        logger.debug("Actions to perform: {}", actions_to_perform)
         
         # Separate GOTO actions from regular actions
         goto_action = next((a for a in actions_to_perform if a.get('type') == 'GOTO_NODE'), None)
@@ -297,123 +631,133 @@ class Orchestrator:
         # Interpolate variables in non-GOTO actions (but skip 'action' field for SET_VARIABLE)
         final_actions = []
         for action in non_goto_actions:
+            templates = self.graph.action_templates.get(id(action))
+            if templates is None:
+                templates = _action_templates(action)
+            if not templates:
+                # Nothing to fill in, but the workflow's dict is shared by every
+                # session through the cached graph, so callers get their own copy
+                final_actions.append(action.copy())
+                continue
             interpolated_action = action.copy()
-            for key, value in interpolated_action.items():
-                # Don't interpolate the 'action' field for SET_VARIABLE actions - it should remain as function name
-                if action.get('type') == 'SET_VARIABLE' and key == 'action':
-                    continue
-                # Don't interpolate 'actionArgs' here - will be handled later with type preservation
-                if action.get('type') == 'SET_VARIABLE' and key == 'actionArgs':
-                    continue
-                interpolated_action[key] = interpolate_variables(value, variables)
+            # Templates were split into segments at load, so only the fill-in happens here
+            for key, segments in templates:
+                interpolated_action[key] = render_template(segments, variables)
             final_actions.append(interpolated_action)
         
         # Update session state for the NEXT call
         if goto_action:
-            logger.debug(f"Found GOTO_NODE action to: {goto_action['target']}")
-            session_state['current_node_id'] = goto_action['target']
-            session_state['current_block_index'] = 0
+            logger.debug("Found GOTO_NODE action to: {}", goto_action['target'])
+            state.current_node_id = goto_action['target']
+            state.current_block_index = 0
             
             # Return non-GOTO actions first; the client will call get_next_step again after processing them
-            logger.debug(f"Returning {len(final_actions)} non-GOTO actions before navigation")
+            logger.debug("Returning {} non-GOTO actions before navigation", len(final_actions))
         else:
             logger.debug("No GOTO_NODE action, incrementing block index")
-            session_state['current_block_index'] += 1
+            state.current_block_index += 1
 
-        logger.debug(f"Final actions to return: {final_actions}")
-        logger.debug(f"Updated session state - node: {session_state['current_node_id']}, block: {session_state['current_block_index']}")
+        logger.debug("Final actions to return: {}", final_actions)
+        logger.debug("Updated session state - node: {}, block: {}", state.current_node_id, state.current_block_index)
         
         # Process actions internally and return only client-facing actions
-        client_actions = self._process_actions_internally(final_actions, session_state)
-        logger.debug(f"Client actions after internal processing: {client_actions}")
+        client_actions = self._process_actions_internally(final_actions, state, variables)
+        logger.debug("Client actions after internal processing: {}", client_actions)
         return client_actions
 
-    def process_user_response(self, session_state: Dict[str, Any], action_id: str, response: Any) -> None:
+    def process_user_response(self, session_state: Union[Dict[str, Any], SessionState], action_id: str, response: Any) -> None:
         """
         Process a user response and update the session state accordingly.
         This is called by the client after user interaction.
         """
-        pending_action = session_state.get('pending_action')
-        if pending_action and pending_action.get('id') == action_id:
-            target_var = pending_action.get('target')
-            if target_var:
-                self.set_variable(session_state, target_var, response)
-                logger.debug(f"User response processed: '{target_var}' = '{response}'")
+        with _session_scope(session_state) as state:
+            pending_action = state.pending_action
+            if pending_action and pending_action.get('id') == action_id:
+                target_var = pending_action.get('target')
+                if target_var:
+                    self.set_variable(state, target_var, response)
+                    logger.debug("User response processed: '{}' = '{}'", target_var, response)
+                else:
+                    logger.debug("User response received but no target variable specified: '{}'", response)
+                # Clear the pending action and advance workflow
+                state.pending_action = None
+                state.current_block_index += 1
             else:
-                logger.debug(f"User response received but no target variable specified: '{response}'")
-            # Clear the pending action and advance workflow
-            session_state.pop('pending_action', None)
-            session_state['current_block_index'] += 1
-        else:
-            logger.debug(f"No matching pending action for id: {action_id}")
+                logger.debug("No matching pending action for id: {}", action_id)
 
-    def _process_actions_internally(self, actions: List[Dict[str, Any]], session_state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _process_actions_internally(self, actions: List[Dict[str, Any]], state: SessionState, variables: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Process actions internally, handling variable management and returning only client-facing actions.
         """
         client_actions = []
+        handlers = self._action_handlers
         
         for action in actions:
-            action_type = action.get('type')
-            logger.debug(f"Processing action internally: {action}")
-            
-            if action_type == 'SET_VARIABLE':
-                target_var = action['target']
-                
-                # Handle both old format (source) and new format (action + actionArgs)
-                if 'source' in action:
-                    source = action['source']
-                    self.set_variable_from_source(session_state, target_var, source)
-                elif 'action' in action:
-                    # New format: execute tool/function call
-                    action_name = action['action']
-                    action_args = action.get('actionArgs', {})
-                    
-                    # Interpolate variables in action arguments (deep) while preserving data types for strings
-                    interpolated_args = self._interpolate_args_deep(action_args, session_state.get('variables', {}))
-                    
-                    if self.tool_registry and self.tool_registry.has_tool(action_name):
-                        try:
-                            result = self.tool_registry.call(action_name, **interpolated_args)
-                            self.set_variable(session_state, target_var, result)
-                            logger.debug(f"Variable '{target_var}' set to function result: {result}")
-                        except Exception as e:
-                            logger.debug(f"Error calling tool '{action_name}': {e}")
-                            self.set_variable(session_state, target_var, None)
-                    else:
-                        logger.debug(f"Tool '{action_name}' not found in registry or no tool registry available")
-                else:
-                    logger.debug(f"SET_VARIABLE action missing both 'source' and 'action' fields: {action}")
-                
-            elif action_type == 'UPDATE_VARIABLE':
-                target_var = action['target']
-                source_var = action['source']
-                operation = action['operation']
-                self.update_variable(session_state, target_var, source_var, operation)
-                
-            elif action_type == 'ANALYZE_RESPONSE':
-                input_val = action['input']
-                output_var = action['output_bool']
-                criteria = action.get('criteria')
-                self.analyze_and_set_variable(session_state, input_val, output_var, criteria)
-                
-            elif action_type in ['PRESENT_CONTENT', 'AWAIT_USER_INPUT']:
-                # These actions need client interaction, so we pass them through
-                if action_type == 'AWAIT_USER_INPUT':
-                    # Add a unique ID for tracking the pending action
-                    import uuid
-                    action_id = str(uuid.uuid4())
-                    action['id'] = action_id
-                    # Store the pending action for later processing
-                    session_state['pending_action'] = action.copy()
-                client_actions.append(action)
-                
-            elif action_type == 'END_WORKFLOW':
-                client_actions.append(action)
-                
-            else:
-                logger.debug(f"Unknown action type: {action_type}")
-                # Pass unknown actions to client as fallback
-                client_actions.append(action)
+            logger.debug("Processing action internally: {}", action)
+            handler = handlers.get(action.get('type'), self._handle_unknown)
+            # Handlers return the action to hand to the client, or None if handled here
+            client_action = handler(action, state, variables)
+            if client_action is not None:
+                client_actions.append(client_action)
         
         return client_actions
+
+    def _handle_set_variable(self, action: Dict[str, Any], state: SessionState, variables: Dict[str, Any]) -> None:
+        """SET_VARIABLE: assign a variable from a source value or a tool call."""
+        target_var = action['target']
+        
+        # Handle both old format (source) and new format (action + actionArgs)
+        if 'source' in action:
+            source = action['source']
+            self.set_variable_from_source(state, target_var, source)
+        elif 'action' in action:
+            # New format: execute tool/function call
+            action_name = action['action']
+            action_args = action.get('actionArgs', {})
+            
+            # Interpolate variables in action arguments (deep) while preserving data types for strings
+            interpolated_args = self._interpolate_args_deep(action_args, variables)
+            
+            if self.tool_registry and self.tool_registry.has_tool(action_name):
+                try:
+                    result = self.tool_registry.call(action_name, **interpolated_args)
+                    self.set_variable(state, target_var, result)
+                    logger.debug("Variable '{}' set to function result: {}", target_var, result)
+                except Exception as e:
+                    logger.debug("Error calling tool '{}': {}", action_name, e)
+                    self.set_variable(state, target_var, None)
+            else:
+                logger.debug("Tool '{}' not found in registry or no tool registry available", action_name)
+        else:
+            logger.debug("SET_VARIABLE action missing both 'source' and 'action' fields: {}", action)
+
+    def _handle_update_variable(self, action: Dict[str, Any], state: SessionState, variables: Dict[str, Any]) -> None:
+        """UPDATE_VARIABLE: apply an operation such as append to a variable."""
+        target_var = action['target']
+        source_var = action['source']
+        operation = action['operation']
+        self.update_variable(state, target_var, source_var, operation)
+
+    def _handle_analyze_response(self, action: Dict[str, Any], state: SessionState, variables: Dict[str, Any]) -> None:
+        """ANALYZE_RESPONSE: set a boolean variable from an analysis tool."""
+        input_val = action['input']
+        output_var = action['output_bool']
+        criteria = action.get('criteria')
+        self.analyze_and_set_variable(state, input_val, output_var, criteria)
+
+    def _handle_await_user_input(self, action: Dict[str, Any], state: SessionState, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """AWAIT_USER_INPUT: record the pending action and pass it to the client."""
+        # Add a unique ID for tracking the pending action
+        action['id'] = f"act-{_action_id_prefix}-{next(_action_counter)}"
+        # Store the pending action for later processing
+        state.pending_action = action.copy()
+        return action
+
+    def _handle_passthrough(self, action: Dict[str, Any], state: SessionState, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Actions that need client interaction, or end the workflow, go to the client as they are."""
+        return action
+
+    def _handle_unknown(self, action: Dict[str, Any], state: SessionState, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Unknown action types are passed to the client as a fallback."""
+        logger.debug("Unknown action type: {}", action.get('type'))
+        return action
@@ -2,16 +2,23 @@
 Tool registry system for domain-specific functions.
 Tools are case-specific functions like "is_a_no", "is_potential_core_state", etc.
 """
+import copy
+import functools
 import inspect
-from typing import Any, Callable, Dict, List, Optional, get_type_hints
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, get_type_hints
 
 from loguru import logger
 from pydantic import BaseModel, Field
 
-from .utils import interpolate_variables, parse_function_call
+from .utils import get_type_string, interpolate_variables, parse_function_call
 
 
-class ToolArgument(BaseModel):
+# Only ever filled in by register(), so a plain slotted dataclass rather than
+# a validated pydantic model; ToolDefinition still serializes it as a nested object
+@dataclass(slots=True, frozen=True)
+class ToolArgument:
     """Definition of a tool argument with type information."""
     name: str
     type: str
@@ -31,88 +38,117 @@ class ToolDefinition(BaseModel):
     examples: List[str] = Field(default_factory=list)
 
 
+def _fast_type_hints(func: Callable) -> Dict[str, Any]:
+    """A function's annotations, resolved with get_type_hints only when some are strings.
+
+    Concrete annotations are already the types get_type_hints would return;
+    string (PEP 563 / forward reference) annotations need evaluating.
+    """
+    annotations = getattr(func, '__annotations__', None)
+    if (
+        isinstance(annotations, dict)
+        and not isinstance(func, type)
+        and not any(isinstance(hint, str) for hint in annotations.values())
+    ):
+        return annotations
+    return get_type_hints(func)
+
+
+@functools.lru_cache(maxsize=512)
+def _introspect(func: Callable) -> Tuple[Tuple[ToolArgument, ...], str]:
+    """Build the argument definitions and return type string for a function.
+
+    Cached per function: signature and type hint resolution dominate the
+    cost of register(), and the same function is often registered again.
+    The frozen ToolArguments, descriptions included, are shared between
+    registrations instead of being rebuilt each time.
+    """
+    # Extract function signature and type hints
+    sig = inspect.signature(func)
+    type_hints = _fast_type_hints(func)
+    
+    arguments = []
+    for param_name, param in sig.parameters.items():
+        param_type = type_hints.get(param_name, type(None))
+        
+        # Convert Python types to string representations
+        type_str = get_type_string(param_type)
+        
+        # Check if parameter has default value
+        has_default = param.default is not inspect.Parameter.empty
+        default_value = param.default if has_default else None
+        
+        arg_def = ToolArgument(
+            name=param_name,
+            type=type_str,
+            default=default_value,
+            required=not has_default,
+            description=f"Parameter {param_name} of type {type_str}"
+        )
+        arguments.append(arg_def)
+    
+    # Get return type
+    return_type = type_hints.get('return', type(None))
+    return tuple(arguments), get_type_string(return_type)
+
+
 class ToolRegistry:
     """Registry for domain-specific tools that process data and make decisions."""
     
     def __init__(self):
         self.tools: Dict[str, Callable] = {}
         self.definitions: Dict[str, ToolDefinition] = {}
+        # Category -> definitions, kept in registration order alongside definitions
+        self._by_category: Dict[str, List[ToolDefinition]] = {}
     
     def register(self, name: str, func: Callable, description: str = "", category: str = "general", examples: Optional[List[str]] = None):
         """Register a tool with complete metadata extraction."""
+        # Interned so lookups with the same name can match on identity
+        name = sys.intern(name)
         self.tools[name] = func
         
-        # Extract function signature and type hints
-        sig = inspect.signature(func)
-        type_hints = get_type_hints(func)
-        
-        arguments = []
-        for param_name, param in sig.parameters.items():
-            param_type = type_hints.get(param_name, type(None))
-            
-            # Convert Python types to string representations
-            type_str = self._get_type_string(param_type)
-            
-            # Check if parameter has default value
-            has_default = param.default != inspect.Parameter.empty
-            default_value = param.default if has_default else None
-            
-            arg_def = ToolArgument(
-                name=param_name,
-                type=type_str,
-                default=default_value,
-                required=not has_default,
-                description=f"Parameter {param_name} of type {type_str}"
-            )
-            arguments.append(arg_def)
-        
-        # Get return type
-        return_type = type_hints.get('return', type(None))
-        return_type_str = self._get_type_string(return_type)
+        arguments, return_type_str = _introspect(func)
         
         # Create tool definition
-        tool_def = ToolDefinition(
+        tool_def = ToolDefinition.model_construct(
             id=name,
             name=name,
             description=description or func.__doc__ or f"Tool {name}",
-            arguments=arguments,
+            arguments=list(arguments),
             return_type=return_type_str,
             category=category,
             examples=examples or []
         )
         
+        previous = self.definitions.get(name)
+        if previous is not None and previous.category == category:
+            # Re-registration keeps the tool's place in its category
+            bucket = self._by_category[category]
+            bucket[bucket.index(previous)] = tool_def
+        else:
+            if previous is not None:
+                self._by_category[previous.category].remove(previous)
+            self._by_category.setdefault(category, []).append(tool_def)
+        
         self.definitions[name] = tool_def
-        logger.debug(f"Registered tool: {name} with {len(arguments)} arguments")
+        logger.debug("Registered tool: {} with {} arguments", name, len(arguments))
     
     def _get_type_string(self, type_hint: Any) -> str:
         """Convert Python type hints to string representations."""
-        if type_hint is type(None) or type_hint is None:
-            return "any"
-        elif type_hint == str:
-            return "string"
-        elif type_hint == int:
-            return "number"
-        elif type_hint == float:
-            return "number"
-        elif type_hint == bool:
-            return "boolean"
-        elif type_hint == list or (hasattr(type_hint, '__origin__') and type_hint.__origin__ == list):
-            return "array"
-        elif type_hint == dict or (hasattr(type_hint, '__origin__') and type_hint.__origin__ == dict):
-            return "object"
-        else:
-            return str(type_hint).replace('<class \'', '').replace('\'>', '').replace('typing.', '')
+        return get_type_string(type_hint)
     
     def call(self, tool_name: str, *args, **kwargs) -> Any:
         """Call a registered tool.
         Note: parameter renamed to avoid clashing with a tool argument named 'name'.
         """
-        if tool_name not in self.tools:
-            logger.debug(f"Tool '{tool_name}' not found in registry")
-            raise ValueError(f"Tool '{tool_name}' not found in registry")
-        logger.debug(f"Calling tool: {tool_name} with args: {args}")
-        result = self.tools[tool_name](*args, **kwargs)
-        logger.debug(f"Tool {tool_name} returned: {result}")
+        try:
+            tool = self.tools[tool_name]
+        except KeyError:
+            logger.debug("Tool '{}' not found in registry", tool_name)
+            raise ValueError(f"Tool '{tool_name}' not found in registry") from None
+        logger.debug("Calling tool: {} with args: {}", tool_name, args)
+        result = tool(*args, **kwargs)
+        logger.debug("Tool {} returned: {}", tool_name, result)
         return result
     
     def has_tool(self, name: str) -> bool:
@@ -129,7 +165,18 @@ class ToolRegistry:
     
     def get_tools_by_category(self, category: str) -> List[ToolDefinition]:
         """Get tools filtered by category."""
-        return [tool_def for tool_def in self.definitions.values() if tool_def.category == category]
+        return list(self._by_category.get(category, ()))
+
+
+# Argument types that are safe to share between calls without copying
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_tool_call(call_string: str) -> Tuple[Optional[str], Tuple[Any, ...]]:
+    """parse_function_call, memoized: the same (interpolated) call strings recur across steps."""
+    tool_name, args = parse_function_call(call_string)
+    return tool_name, tuple(args)
 
 
 def execute_tool_call(call_string: str, variables: Optional[Dict[str, Any]] = None, registry: Optional['ToolRegistry'] = None):
@@ -139,25 +186,31 @@ def execute_tool_call(call_string: str, variables: Optional[Dict[str, Any]] = No
     if registry is None:
         raise ValueError("Registry must be provided")
     
-    logger.debug(f"Executing tool call: {call_string}")
-    logger.debug(f"Available variables: {variables}")
+    logger.debug("Executing tool call: {}", call_string)
+    logger.debug("Available variables: {}", variables)
     
     # First interpolate any variables in the call string
     interpolated_call = interpolate_variables(call_string, variables)
-    logger.debug(f"After interpolation: {interpolated_call}")
+    logger.debug("After interpolation: {}", interpolated_call)
     
     # Parse the tool call
-    tool_name, args = parse_function_call(interpolated_call)
+    tool_name, args = _parse_tool_call(interpolated_call)
     if not tool_name:
         logger.debug("No tool name found")
         return None
     
-    # Execute the tool if it exists
-    if registry.has_tool(tool_name):
-        return registry.call(tool_name, *args)
+    # Execute the tool if it exists; one lookup rather than has_tool() then call()
+    tool = registry.tools.get(tool_name)
+    if tool is None:
+        logger.debug("Tool {} not found in registry", tool_name)
+        return None
     
-    logger.debug(f"Tool {tool_name} not found in registry")
-    return None
+    # Cached args are shared between calls, so tools get their own copy of
+    # anything that is not an immutable scalar (a tuple can still hold a list)
+    if not all(type(arg) in _SCALAR_TYPES for arg in args):
+        args = copy.deepcopy(args)
+    logger.debug("Calling tool: {} with args: {}", tool_name, args)
+    return tool(*args)
 
 
 # Legacy compatibility - keep old names for backward compatibility
@@ -1,54 +1,150 @@
 """
-Utility functions for function call parsing and variable interpolation.
+Utility functions for function call parsing, variable interpolation and type strings.
 """
 import ast
+import functools
 import re
+import sys
 from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
+# function_name(arg1, arg2, ...); \Z rather than $, which would also accept a trailing newline
+_FUNC_CALL_PATTERN = re.compile(r'(\w+)\((.*)\)\Z')
+
+# One scalar literal without escapes: a quoted string, an int or decimal, or a keyword
+_SIMPLE_ARG = r'"[^"\\]*"|\'[^\'\\]*\'|-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?|True|False|None'
+_SIMPLE_ARG_PATTERN = re.compile(_SIMPLE_ARG)
+# A comma-separated list of such literals, the shape nearly all tool calls take
+_SIMPLE_ARGS_PATTERN = re.compile(rf'(?:{_SIMPLE_ARG})(?:\s*,\s*(?:{_SIMPLE_ARG}))*')
+
+_KEYWORD_LITERALS = {'True': True, 'False': False, 'None': None}
+
+
+def _parse_simple_args(args_str: str) -> List:
+    """Convert a list of simple literals without going through ast.literal_eval."""
+    args = []
+    for token in _SIMPLE_ARG_PATTERN.findall(args_str):
+        if token[0] in '"\'':
+            args.append(token[1:-1])
+        elif token in _KEYWORD_LITERALS:
+            args.append(_KEYWORD_LITERALS[token])
+        elif '.' in token:
+            args.append(float(token))
+        else:
+            args.append(int(token))
+    return args
+
 
 def parse_function_call(call_string: str) -> Tuple[Optional[str], List]:
     """Parse a function call string and return function name and arguments."""
-    logger.debug(f"Parsing function call: {call_string}")
+    logger.debug("Parsing function call: {}", call_string)
     # Match pattern: function_name(arg1, arg2, ...)
-    match = re.match(r'(\w+)\((.*)\)$', call_string.strip())
+    match = _FUNC_CALL_PATTERN.match(call_string.strip())
     if not match:
         logger.debug("No function call pattern matched")
         return None, []
     
-    func_name = match.group(1)
+    # Interned like registry keys, so the registry lookup can match on identity
+    func_name = sys.intern(match.group(1))
     args_str = match.group(2).strip()
     
     if not args_str:
-        logger.debug(f"Function {func_name} with no arguments")
+        logger.debug("Function {} with no arguments", func_name)
         return func_name, []
     
+    # Plain scalars are converted directly; anything else goes through the full parser
+    if _SIMPLE_ARGS_PATTERN.fullmatch(args_str):
+        args = _parse_simple_args(args_str)
+        logger.debug("Parsed function {} with args: {}", func_name, args)
+        return func_name, args
+    
     # Try to parse arguments
     try:
         # Wrap in list to make it valid Python syntax
         args = ast.literal_eval(f'[{args_str}]')
-        logger.debug(f"Parsed function {func_name} with args: {args}")
+        logger.debug("Parsed function {} with args: {}", func_name, args)
         return func_name, args
     except Exception:
         # If literal_eval fails, treat as single string argument
-        logger.debug(f"Failed to parse args, treating as single string: {args_str}")
+        logger.debug("Failed to parse args, treating as single string: {}", args_str)
         return func_name, [args_str]
 
 
+_PLACEHOLDER_PATTERN = re.compile(r'\{([\w\s]+)\}')
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_template(text: str) -> Tuple[Tuple[Optional[str], str], ...]:
+    """Split text into (variable name, raw text) segments; literals have no name.
+
+    Returns an empty tuple when text has no placeholders. Workflow payloads
+    repeat across executions, so each one is parsed once.
+    """
+    segments = []
+    position = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(text):
+        if match.start() > position:
+            segments.append((None, text[position:match.start()]))
+        segments.append((match.group(1), match.group(0)))
+        position = match.end()
+    if segments and position < len(text):
+        segments.append((None, text[position:]))
+    return tuple(segments)
+
+
 def interpolate_variables(text: str, variables: Dict[str, Any]) -> str:
     """Replace {Variable Name} placeholders with actual values."""
     if not isinstance(text, str):
         return text
+    # No placeholder, or nothing to fill one with: the text comes back unchanged
+    if not variables or '{' not in text:
+        return text
     
-    logger.debug(f"Interpolating: '{text}' with variables: {variables}")
+    logger.debug("Interpolating: '{}' with variables: {}", text, variables)
     
-    matches = re.findall(r'\{([\w\s]+)\}', text)
-    for var_name in matches:
-        if var_name in variables and variables[var_name] is not None:
-            replacement = str(variables[var_name])
-            text = text.replace(f'{{{var_name}}}', replacement)
-            logger.debug(f"Replaced {{{var_name}}} with '{replacement}'")
+    segments = compile_template(text)
+    if not segments:
+        logger.debug("Final interpolated text: '{}'", text)
+        return text
     
-    logger.debug(f"Final interpolated text: '{text}'")
+    text = render_template(segments, variables)
+    logger.debug("Final interpolated text: '{}'", text)
     return text
+
+
+def render_template(segments: Tuple[Tuple[Optional[str], str], ...], variables: Dict[str, Any]) -> str:
+    """Fill in segments from compile_template with variable values."""
+    parts = []
+    for var_name, raw in segments:
+        value = variables.get(var_name) if var_name is not None else None
+        # Literal text, or a placeholder with no value, is kept as written
+        parts.append(raw if value is None else str(value))
+    return ''.join(parts)
+
+
+# Python type -> frontend type string; also consulted for the origin of
+# generic hints, so List[int] resolves through list
+_TYPE_MAP: Dict[Any, str] = {
+    type(None): "any",
+    None: "any",
+    str: "string",
+    int: "number",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
+
+
+def get_type_string(type_hint: Any) -> str:
+    """Convert a Python type hint to the type string shown in the registries."""
+    # Generic aliases like List[int] resolve through their origin; plain types are their own
+    origin = getattr(type_hint, '__origin__', type_hint)
+    try:
+        type_str = _TYPE_MAP.get(origin)
+    except TypeError:  # unhashable hint
+        type_str = None
+    if type_str is None:
+        type_str = str(type_hint).replace('<class \'', '').replace('\'>', '').replace('typing.', '')
+    return type_str
@@ -0,0 +1,75 @@
+"""
+Tests for the condition strings accepted by CONDITION blocks.
+"""
+import pytest
+
+from journey import Orchestrator, WorkflowGraph
+
+
+@pytest.fixture
+def orchestrator():
+    return Orchestrator(WorkflowGraph.from_workflow({"nodes": []}))
+
+
+VARIABLES = {
+    "Flag": True,
+    "Off": False,
+    "Count": 5,
+    "Name": "Hello",
+    "Items": [],
+}
+
+
+@pytest.mark.parametrize(
+    "condition, expected",
+    [
+        # JS-style booleans
+        ("{Flag} == true", True),
+        ("{Flag} == false", False),
+        ("{Off} == false", True),
+        ("{Flag} != true", False),
+        # Numeric comparisons, including chains
+        ("{Count} > 3", True),
+        ("{Count} >= 5", True),
+        ("{Count} < 5", False),
+        ("{Count} == 5.0", True),
+        ("1 < {Count} < 10", True),
+        ("-{Count} < 0", True),
+        # Quoted strings compare case-sensitively, as Python does
+        ("'{Name}' == 'Hello'", True),
+        ("'{Name}' == 'hello'", False),
+        ("'{Name}' in ['Hello', 'Bye']", True),
+        ("'{Name}' not in ('Hello',)", False),
+        # Compound expressions
+        ("{Count} > 3 and {Flag} == true", True),
+        ("{Count} > 10 or {Off} == false", True),
+        ("not {Off}", True),
+        ("({Count} > 3) and not ({Count} > 10)", True),
+        ("{Items} == []", True),
+        ("{Flag} is True", True),
+        # A bare value is a truthiness check
+        ("{Flag}", True),
+        ("  {Flag} == true  ", True),
+    ],
+)
+def test_supported_conditions(orchestrator, condition, expected):
+    assert orchestrator._evaluate_condition(condition, VARIABLES) == expected
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        # Unquoted words are names, which conditions cannot reference
+        "{Name} == Hello",
+        "__import__('os').system('true')",
+        "'{Name}'.lower() == 'hello'",
+        "{Count} + 1 > 5",
+        "{Count} >",
+    ],
+)
+def test_unsupported_conditions_are_false(orchestrator, condition):
+    assert orchestrator._evaluate_condition(condition, VARIABLES) is False
+
+
+def test_type_errors_are_false(orchestrator):
+    assert orchestrator._evaluate_condition("{Count} > 'a'", VARIABLES) is False